@@ -121,6 +121,10 @@ THREAD_CHECK_INTERVAL = 100
 # Character name cache refresh delay (milliseconds)
 CACHE_REFRESH_DELAY = 100
 
+# Debounce delays before saving window geometry (milliseconds)
+WINDOW_SAVE_DELAY = 500
+WINDOW_SAVE_DRAG_DELAY = 750  # Used while configure events arrive <100ms apart
+
 
 # =============================================================================
 # Tree/List View Settings
@@ -131,6 +135,18 @@ CHAR_NAME_COLUMN_WIDTH = 250
 CHAR_DATE_COLUMN_WIDTH = 150
 CHAR_NOTE_COLUMN_WIDTH = 200
 
+# Treeview row height in pixels (also used to estimate visible rows)
+TREEVIEW_ROW_HEIGHT = 38
+
+# Lazy treeview population: minimum rows inserted per batch, and the scroll
+# position (fraction of content shown) at which the next batch is inserted
+LAZY_TREE_MIN_BATCH = 20
+LAZY_TREE_LOAD_THRESHOLD = 0.9
+
+# Delay used to coalesce rapid treeview sorts and scroll-driven row loads
+# into one redraw per frame (milliseconds)
+TREE_REDRAW_DELAY = 16
+
 # Account treeview column widths
 ACCOUNT_ID_COLUMN_WIDTH = 120
 ACCOUNT_NAME_COLUMN_WIDTH = 180
@@ -4,8 +4,12 @@ Handles loading and saving data to/from the JSON data file.
 """
 
 import json
+import os
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Set, Optional, List
+from typing import Dict, Set, Optional, List, Iterable, Tuple
 from datetime import datetime, timezone
 from utils import DataFileError, ValidationError
 import config
@@ -60,6 +64,8 @@ class DataFile:
             file_path = Path(__file__).parent.parent / config.DATA_FILE_NAME
         self.file_path = Path(file_path)
         self._data: Dict = {}
+        # save() runs on both the Tk thread and the loader thread
+        self._save_lock = threading.Lock()
         
     def load(self) -> Dict:
         """Load all data from the JSON file.
@@ -145,9 +151,10 @@ class DataFile:
             DataFileError: If the file cannot be written.
         """
         try:
-            self._ensure_directory_exists()
-            ordered_data = self._prepare_data_for_save()
-            self._write_to_file(ordered_data)
+            with self._save_lock:
+                self._ensure_directory_exists()
+                ordered_data = self._prepare_data_for_save()
+                self._write_to_file(ordered_data)
             return True
         except PermissionError as e:
             raise DataFileError(
@@ -186,6 +193,12 @@ class DataFile:
     def _write_to_file(self, data: Dict) -> None:
         """Write data to the JSON file.
         
+        The JSON is serialized in memory and written with a single write
+        to a uniquely named temporary file, which then atomically replaces
+        the data file. The temporary file gets the data file's permissions
+        (or the umask default for a new file) since mkstemp creates it 0600,
+        and it is removed if anything fails.
+        
         Args:
             data: Dictionary to serialize and write.
             
@@ -193,8 +206,33 @@ class DataFile:
             PermissionError: If file cannot be written.
             OSError: If file operation fails.
         """
-        with self.file_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        payload = json.dumps(data, indent=2).encode('utf-8')
+        fd, tmp_name = tempfile.mkstemp(dir=self.file_path.parent,
+                                        prefix=self.file_path.name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.chmod(tmp_name, self._file_mode())
+            os.replace(tmp_name, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+    
+    def _file_mode(self) -> int:
+        """Return the permission bits a saved data file should have.
+        
+        Returns:
+            The existing file's mode, or 0o666 less the umask for a new file.
+        """
+        try:
+            return stat.S_IMODE(os.stat(self.file_path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
     
     def get_character_names(self) -> Dict[str, str]:
         """Get cached character ID to name mappings.
@@ -214,6 +252,21 @@ class DataFile:
         
         return result
     
+    def get_character_names_int(self) -> Dict[int, str]:
+        """Get cached character names keyed by integer ID.
+        
+        Same as get_character_names() but builds the int-keyed mapping the
+        ESI cache uses directly, avoiding a second conversion pass.
+        
+        Returns:
+            Dictionary mapping character IDs (as ints) to character names.
+        """
+        return {
+            int(char_id): value['name']
+            for char_id, value in self._data.get('character_ids', {}).items()
+            if isinstance(value, dict) and value.get('valid', True) and value.get('name')
+        }
+    
     def save_character_name(self, char_id: str, name: str, valid: bool = True) -> None:
         """Save a character ID with full metadata.
         
@@ -242,6 +295,29 @@ class DataFile:
             'note': existing_note
         }
     
+    def set_character_names(self, names: Dict[str, str]) -> None:
+        """Save many valid character names in one pass.
+        
+        Bulk equivalent of save_character_name(); existing notes are
+        preserved and every entry shares a single 'checked' timestamp.
+        
+        Args:
+            names: Dictionary mapping character IDs to character names.
+        """
+        char_data = self._data.setdefault('character_ids', {})
+        checked = datetime.now(timezone.utc).isoformat()
+        
+        for char_id, name in names.items():
+            char_id_str = str(char_id)
+            existing = char_data.get(char_id_str)
+            existing_note = existing.get('note', '') if isinstance(existing, dict) else ''
+            char_data[char_id_str] = {
+                'name': name,
+                'valid': True,
+                'checked': checked,
+                'note': existing_note
+            }
+    
     def get_invalid_ids(self) -> Set[str]:
         """Get set of invalid character IDs.
         
@@ -257,6 +333,21 @@ class DataFile:
         
         return invalid
     
+    def get_invalid_ids_int(self) -> Set[int]:
+        """Get invalid character IDs as integers.
+        
+        Same as get_invalid_ids() but builds the int set the ESI cache uses
+        directly, avoiding a second conversion pass.
+        
+        Returns:
+            Set of character IDs (as ints) marked as invalid.
+        """
+        return {
+            int(char_id)
+            for char_id, value in self._data.get('character_ids', {}).items()
+            if isinstance(value, dict) and not value.get('valid', True)
+        }
+    
     def add_invalid_id(self, char_id: str) -> None:
         """Mark a character ID as invalid.
         
@@ -282,6 +373,28 @@ class DataFile:
             'note': existing_note
         }
     
+    def add_invalid_ids(self, char_ids: Iterable[str]) -> None:
+        """Mark many character IDs as invalid in one pass.
+        
+        Bulk equivalent of add_invalid_id(); existing notes are preserved.
+        
+        Args:
+            char_ids: Character IDs to mark as invalid.
+        """
+        char_data = self._data.setdefault('character_ids', {})
+        checked = datetime.now(timezone.utc).isoformat()
+        
+        for char_id in char_ids:
+            char_id_str = str(char_id)
+            existing = char_data.get(char_id_str)
+            existing_note = existing.get('note', '') if isinstance(existing, dict) else ''
+            char_data[char_id_str] = {
+                'name': '',
+                'valid': False,
+                'checked': checked,
+                'note': existing_note
+            }
+    
     def get_character_notes(self) -> Dict[str, str]:
         """Get all character notes.
         
@@ -299,6 +412,36 @@ class DataFile:
         
         return notes
     
+    def get_character_data(self) -> Tuple[Dict[int, str], Set[int], Dict[str, str]]:
+        """Split character entries into names, invalid IDs and notes in one pass.
+        
+        Startup needs all three; this walks character_ids once instead of
+        once per getter (get_character_names_int, get_invalid_ids_int,
+        get_character_notes).
+        
+        Returns:
+            Tuple of (valid names keyed by int ID, invalid int IDs,
+            non-empty notes keyed by string ID).
+        """
+        names: Dict[int, str] = {}
+        invalid: Set[int] = set()
+        notes: Dict[str, str] = {}
+        
+        for char_id, value in self._data.get('character_ids', {}).items():
+            if not isinstance(value, dict):
+                continue
+            if value.get('valid', True):
+                name = value.get('name')
+                if name:
+                    names[int(char_id)] = name
+            else:
+                invalid.add(int(char_id))
+            note = value.get('note')
+            if note:
+                notes[char_id] = note
+        
+        return names, invalid, notes
+    
     def get_account_notes(self) -> Dict[str, str]:
         """Get all account notes.
         
@@ -316,13 +459,16 @@ class DataFile:
         
         return notes
     
-    def set_character_note(self, char_id: str, note: str) -> None:
+    def set_character_note(self, char_id: str, note: str) -> bool:
         """Set a note for a character.
         
         Args:
             char_id: Character ID.
             note: Note text (max length defined in config).
             
+        Returns:
+            True if the stored note changed and the data needs saving.
+            
         Raises:
             ValidationError: If note exceeds maximum length.
         """
@@ -331,40 +477,36 @@ class DataFile:
                 f"Character note exceeds maximum length of {config.MAX_NOTE_LENGTH} characters (got {len(note)})"
             )
         
-        char_id_str = str(char_id)
-        
-        if 'character_ids' not in self._data:
-            self._data['character_ids'] = {}
+        char_ids = self._data.setdefault('character_ids', {})
+        existing = char_ids.get(str(char_id))
         
-        if char_id_str in self._data['character_ids']:
-            # Update existing entry
-            existing = self._data['character_ids'][char_id_str]
-            if isinstance(existing, dict):
-                existing['note'] = note
-            else:
-                # Should not happen in single-format version, but handle it
-                self._data['character_ids'][char_id_str] = {
-                    'name': '',
-                    'valid': True,
-                    'checked': datetime.now(timezone.utc).isoformat(),
-                    'note': note
-                }
+        if isinstance(existing, dict):
+            if existing.get('note', '') == note:
+                return False
+            # Update existing entry in place
+            existing['note'] = note
         else:
+            if not note and existing is None:
+                return False
             # Create new entry with note
-            self._data['character_ids'][char_id_str] = {
+            char_ids[str(char_id)] = {
                 'name': '',
                 'valid': True,
                 'checked': datetime.now(timezone.utc).isoformat(),
                 'note': note
             }
+        return True
     
-    def set_account_note(self, account_id: str, note: str) -> None:
+    def set_account_note(self, account_id: str, note: str) -> bool:
         """Set a note for an account.
         
         Args:
             account_id: Account ID.
             note: Note text (max length defined in config).
             
+        Returns:
+            True if the stored note changed and the data needs saving.
+            
         Raises:
             ValidationError: If note exceeds maximum length.
         """
@@ -373,26 +515,22 @@ class DataFile:
                 f"Account note exceeds maximum length of {config.MAX_NOTE_LENGTH} characters (got {len(note)})"
             )
         
-        account_id_str = str(account_id)
-        
-        if 'account_ids' not in self._data:
-            self._data['account_ids'] = {}
+        account_ids = self._data.setdefault('account_ids', {})
+        existing = account_ids.get(str(account_id))
         
-        if account_id_str in self._data['account_ids']:
-            # Update existing entry
-            existing = self._data['account_ids'][account_id_str]
-            if isinstance(existing, dict):
-                existing['note'] = note
-            else:
-                # Should not happen in single-format version, but handle it
-                self._data['account_ids'][account_id_str] = {
-                    'note': note
-                }
+        if isinstance(existing, dict):
+            if existing.get('note', '') == note:
+                return False
+            # Update existing entry in place
+            existing['note'] = note
         else:
+            if not note and existing is None:
+                return False
             # Create new entry with note
-            self._data['account_ids'][account_id_str] = {
+            account_ids[str(account_id)] = {
                 'note': note
             }
+        return True
     
     def get_character_checked_time(self, char_id: str) -> Optional[str]:
         """Get the last ESI check timestamp for a character.
@@ -1,7 +1,8 @@
 """Character name caching for PyEveSettings."""
 
-from typing import Dict, Set, Optional, List
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Set, Optional, List, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from utils import InvalidCharacterError
 from .esi_client import ESIClient
 
 
@@ -17,6 +18,8 @@ class ESICache:
         self.esi_client = esi_client or ESIClient()
         self._cache: Dict[int, str] = {}
         self._invalid_ids: Set[int] = set()
+        # IDs resolved or invalidated since the last pop_changes()
+        self._dirty_ids: Set[int] = set()
     
     def load_cache(self, character_names: Dict[int, str], invalid_ids: Set[int]) -> None:
         """Load cache from existing data.
@@ -69,6 +72,7 @@ class ESICache:
             name: Character name.
         """
         self._cache[char_id] = name
+        self._dirty_ids.add(char_id)
     
     def mark_invalid(self, char_id: int) -> None:
         """Mark character ID as invalid.
@@ -77,6 +81,7 @@ class ESICache:
             char_id: Character ID.
         """
         self._invalid_ids.add(char_id)
+        self._dirty_ids.add(char_id)
     
     def get_all_cached(self) -> Dict[int, str]:
         """Get all cached character names.
@@ -94,6 +99,20 @@ class ESICache:
         """
         return self._invalid_ids.copy()
     
+    def pop_changes(self) -> Tuple[Dict[int, str], Set[int]]:
+        """Get the entries changed since the last call and reset tracking.
+        
+        Lets callers persist only what a fetch actually resolved instead of
+        rewriting the whole cache.
+        
+        Returns:
+            Tuple of (changed ID -> name mappings, newly invalid IDs).
+        """
+        dirty, self._dirty_ids = self._dirty_ids, set()
+        names = {cid: self._cache[cid] for cid in dirty if cid in self._cache}
+        invalid = {cid for cid in dirty if cid in self._invalid_ids}
+        return names, invalid
+    
     def fetch_names_bulk(self, character_ids: List[int]) -> Dict[int, str]:
         """Fetch character names for multiple IDs, using cache where possible.
         
@@ -107,20 +126,20 @@ class ESICache:
             return {}
         
         # Deduplicate
-        unique_ids = list(set(character_ids))
-        
-        if not unique_ids:
-            return {}
-        
-        # Find IDs we need to fetch (skip cached and invalid)
-        ids_to_fetch = [
-            cid for cid in unique_ids 
-            if cid not in self._cache and cid not in self._invalid_ids
-        ]
-        
-        # Count statistics
-        cached_count = len([cid for cid in unique_ids if cid in self._cache])
-        invalid_count = len([cid for cid in unique_ids if cid in self._invalid_ids])
+        unique_ids = set(character_ids)
+        
+        # Find IDs we need to fetch (skip cached and invalid), counting the
+        # skipped ones in the same pass
+        ids_to_fetch = []
+        cached_count = 0
+        invalid_count = 0
+        for cid in unique_ids:
+            if cid in self._cache:
+                cached_count += 1
+            elif cid in self._invalid_ids:
+                invalid_count += 1
+            else:
+                ids_to_fetch.append(cid)
         
         # All IDs already processed
         if not ids_to_fetch:
@@ -137,27 +156,52 @@ class ESICache:
         if invalid_count > 0:
             print(f"Skipping {invalid_count} known invalid IDs.")
         
-        # Use thread pool for concurrent requests
+        # Resolve names in batches, one request per batch, run concurrently
         failed_ids = []
+        batch_size = self.esi_client.NAMES_BATCH_SIZE
         with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_id = {
-                executor.submit(self.esi_client.fetch_character_name, cid): cid 
-                for cid in ids_to_fetch
+            pending = {
+                executor.submit(self.esi_client.fetch_names, batch): batch
+                for batch in (
+                    ids_to_fetch[start:start + batch_size]
+                    for start in range(0, len(ids_to_fetch), batch_size)
+                )
             }
             
-            for future in future_to_id:
-                char_id = future_to_id[future]
-                try:
-                    result = future.result()
-                    if result:
-                        self._cache[char_id] = result
-                    else:
-                        # Mark as invalid
-                        self._invalid_ids.add(char_id)
-                        failed_ids.append(char_id)
-                except Exception as e:
-                    print(f"  Exception fetching character {char_id}: {e}")
-                    failed_ids.append(char_id)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = pending.pop(future)
+                    try:
+                        names = future.result()
+                    except InvalidCharacterError:
+                        if len(batch) == 1:
+                            # Mark as invalid
+                            self.mark_invalid(batch[0])
+                            failed_ids.append(batch[0])
+                            continue
+                        # ESI rejects a whole batch for one unknown ID; split it
+                        # in half until the invalid IDs are isolated
+                        middle = len(batch) // 2
+                        for half in (batch[:middle], batch[middle:]):
+                            pending[executor.submit(self.esi_client.fetch_names, half)] = half
+                        continue
+                    except Exception as e:
+                        print(f"  Exception fetching {len(batch)} character names: {e}")
+                        failed_ids.extend(batch)
+                        continue
+                    
+                    for char_id in batch:
+                        name = names.get(char_id)
+                        if name:
+                            self.add(char_id, name)
+                        else:
+                            # Resolved, but not to a character
+                            self.mark_invalid(char_id)
+                            failed_ids.append(char_id)
+        
+        # The workers are done; don't leave their keep-alive connections open
+        self.esi_client.close()
         
         if failed_ids:
             print(f"Failed to fetch {len(failed_ids)} character name(s).")
@@ -1,9 +1,11 @@
 """ESI API client for EVE Online character information."""
 
+import gzip
 import http.client
 import json
 import socket
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from utils import ESIError, InvalidCharacterError
 
 
@@ -14,6 +16,24 @@ class ESIClient:
     TIMEOUT = 10
     MAX_RETRIES = 3
     USER_AGENT = "PyEveSettings"
+    # Most IDs /universe/names/ accepts in one request
+    NAMES_BATCH_SIZE = 1000
+    
+    def __init__(self):
+        """Initialize the client."""
+        # Per-thread keep-alive connection (see _get_connection), plus every
+        # open connection so close() can reach those of finished worker threads
+        self._local = threading.local()
+        self._connections: List[http.client.HTTPSConnection] = []
+        self._connections_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close all keep-alive connections, e.g. at the end of a bulk fetch."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
     
     def fetch_character_name(self, char_id: int) -> Optional[str]:
         """Fetch a single character name from ESI API.
@@ -70,35 +90,129 @@ class ESIClient:
         
         return None
     
-    def _make_request(self, path: str) -> Optional[dict]:
+    def fetch_names(self, char_ids: List[int]) -> Dict[int, str]:
+        """Resolve a batch of character IDs to names with a single request.
+        
+        Uses the /universe/names/ endpoint, which takes up to
+        NAMES_BATCH_SIZE IDs per request.
+        
+        Args:
+            char_ids: Character IDs to resolve.
+            
+        Returns:
+            Dictionary mapping character ID to name for the resolved characters.
+            
+        Raises:
+            ESIError: If API connection fails after retries or unexpected error occurs.
+            InvalidCharacterError: If any ID in the batch is unknown (404); ESI
+                rejects the whole batch in that case.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                result = self._make_request("/latest/universe/names/", body=char_ids)
+                
+                return {
+                    entry['id']: entry['name']
+                    for entry in result or []
+                    if entry.get('category') == 'character'
+                }
+            
+            except (InvalidCharacterError, ESIError):
+                raise
+            
+            except (socket.timeout, socket.error, ConnectionError) as e:
+                if attempt < self.MAX_RETRIES - 1:
+                    print(f"  Connection error resolving {len(char_ids)} names, retrying...")
+                    continue
+                else:
+                    raise ESIError(
+                        f"Connection error resolving {len(char_ids)} names after {self.MAX_RETRIES} attempts: {e}"
+                    ) from e
+                    
+            except Exception as e:
+                raise ESIError(
+                    f"Unexpected error resolving {len(char_ids)} names: {e}"
+                ) from e
+        
+        return {}
+    
+    def _get_connection(self) -> Tuple[http.client.HTTPSConnection, bool]:
+        """Get this thread's keep-alive connection to ESI, opening one if needed.
+        
+        Connections are per thread because http.client connections can't be
+        shared between concurrent requests.
+        
+        Returns:
+            Tuple of (connection, reused) where reused is True if the
+            connection has served an earlier request.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn, True
+        conn = http.client.HTTPSConnection(self.ESI_HOST, timeout=self.TIMEOUT)
+        with self._connections_lock:
+            self._connections.append(conn)
+            self._local.conn = conn
+        return conn, False
+    
+    def _close_connection(self) -> None:
+        """Close and forget this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._connections_lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+    
+    def _make_request(self, path: str, body: Optional[Any] = None) -> Optional[Any]:
         """Make an HTTPS request to ESI API.
         
+        The connection is kept open and reused by later requests from the
+        same thread, so bulk lookups don't pay a TCP/TLS handshake per request.
+        
         Args:
             path: API endpoint path (e.g., "/latest/characters/12345/").
+            body: Optional JSON body; if given the request is sent as a POST.
             
         Returns:
-            Parsed JSON response as dict, or None if request failed.
+            Parsed JSON response, or None if request failed.
         """
-        conn = None
+        conn, reused = self._get_connection()
+        
+        headers = {
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip',
+            'User-Agent': self.USER_AGENT
+        }
+        
         try:
-            conn = http.client.HTTPSConnection(self.ESI_HOST, timeout=self.TIMEOUT)
-            
-            headers = {
-                'Accept': 'application/json',
-                'User-Agent': self.USER_AGENT
-            }
-            
-            conn.request("GET", path, headers=headers)
+            if body is None:
+                conn.request("GET", path, headers=headers)
+            else:
+                headers['Content-Type'] = 'application/json'
+                conn.request("POST", path, body=json.dumps(body), headers=headers)
             response = conn.getresponse()
             data = response.read()
-            
-            return self._handle_response(response.status, data)
-            
-        finally:
-            if conn:
-                conn.close()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self._close_connection()
+            if reused:
+                # ESI closed the idle keep-alive connection; retry once on a new one
+                return self._make_request(path, body)
+            raise
+        except Exception:
+            # The connection is in an unknown state; don't reuse it
+            self._close_connection()
+            raise
+        
+        if response.will_close:
+            self._close_connection()
+        if response.getheader('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        
+        return self._handle_response(response.status, data)
     
-    def _handle_response(self, status_code: int, data: bytes) -> Optional[dict]:
+    def _handle_response(self, status_code: int, data: bytes) -> Optional[Any]:
         """Handle HTTP response from ESI API.
         
         Args:
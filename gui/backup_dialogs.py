@@ -3,6 +3,7 @@
 Contains dialog classes for creating, restoring, and viewing backup details.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
@@ -67,11 +68,13 @@ class CreateBackupDialog:
             
             # Find settings folders
             if parent_dir.exists():
-                for item in parent_dir.iterdir():
-                    if item.is_dir() and item.name.startswith('settings'):
-                        profile_display = f"{item.name} ({server_name})"
-                        self.profiles.append((profile_display, item, backup_dir_info['backup_dir']))
-                        self.listbox.insert(tk.END, profile_display)
+                with os.scandir(parent_dir) as entries:
+                    for entry in entries:
+                        # Name check first; the type check is only needed for matches
+                        if entry.name.startswith('settings') and entry.is_dir():
+                            profile_display = f"{entry.name} ({server_name})"
+                            self.profiles.append((profile_display, Path(entry.path), backup_dir_info['backup_dir']))
+                            self.listbox.insert(tk.END, profile_display)
         
         if not self.profiles:
             self.listbox.insert(tk.END, "No profiles found")
@@ -102,7 +105,6 @@ class CreateBackupDialog:
     
     def _center_dialog(self, parent, width: int, height: int):
         """Center dialog over parent."""
-        self.dialog.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() - width) // 2
         y = parent.winfo_y() + (parent.winfo_height() - height) // 2
         self.dialog.geometry(f"{width}x{height}+{x}+{y}")
@@ -295,11 +297,12 @@ class ViewDetailsDialog:
         
         try:
             with zipfile.ZipFile(backup_path, 'r') as zipf:
-                files = zipf.namelist()[:50]
-                for file in files:
-                    details += f"  {file}\n"
-                if len(zipf.namelist()) > 50:
-                    details += f"\n  ... and {len(zipf.namelist()) - 50} more files\n"
+                # infolist() returns the parsed directory as-is; namelist() builds a new list per call
+                infos = zipf.infolist()
+                for info in infos[:50]:
+                    details += f"  {info.filename}\n"
+                if len(infos) > 50:
+                    details += f"\n  ... and {len(infos) - 50} more files\n"
         except Exception as e:
             details += f"  Error reading backup contents: {e}\n"
         
@@ -314,7 +317,6 @@ class ViewDetailsDialog:
     
     def _center_dialog(self, parent, width: int, height: int):
         """Center dialog over parent."""
-        self.dialog.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() - width) // 2
         y = parent.winfo_y() + (parent.winfo_height() - height) // 2
         self.dialog.geometry(f"{width}x{height}+{x}+{y}")
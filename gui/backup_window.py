@@ -14,12 +14,11 @@ from pathlib import Path
 from typing import Optional, List, Dict
 from datetime import datetime
 import threading
-import platform
 import subprocess
 import queue
 
 from utils import BackupManager, EVEPathResolver
-from .helpers import center_dialog
+from .helpers import center_dialog, delete_all_items
 from .backup_dialogs import CreateBackupDialog, RestoreBackupDialog, ViewDetailsDialog
 from .backup_operations import BackupOperations
 import config
@@ -70,7 +69,6 @@ class BackupManagerWindow:
         self._start_result_poller()
         
         # Center window
-        self.window.update_idletasks()
         center_dialog(self.window, parent, default_width, default_height)
         
         # Load initial data
@@ -629,16 +627,16 @@ class BackupManagerWindow:
     
     def _populate_treeview(self):
         """Populate treeview with filtered backups."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single call
+        delete_all_items(self.tree)
         
         # Add filtered backups
         for backup in self.filtered_backups:
-            # Format datetime
-            dt_str = ""
-            if backup.get('datetime'):
-                dt_str = backup['datetime'].strftime("%Y-%m-%d %H:%M:%S")
+            # Format datetime once per backup; filtering re-populates often
+            dt_str = backup.get('datetime_str')
+            if dt_str is None:
+                dt = backup.get('datetime')
+                dt_str = backup['datetime_str'] = dt.strftime("%Y-%m-%d %H:%M:%S") if dt else ""
             
             # Format size
             size_str = f"{backup.get('size_mb', 0):.1f} MB"
@@ -1,15 +1,20 @@
 """Dialog windows for py-eve-settings."""
 
+import logging
+import os
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import List, Optional, Callable, Tuple
-from datetime import datetime
+from tkinter import ttk, messagebox
+from typing import Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 from utils.models import SettingFile
 from data import NotesManager
-from .helpers import sort_tree, center_dialog
+from .helpers import build_file_rows, center_dialog, clear_tree, sort_rows, update_sort_headings, set_tree_rows, lazy_yscrollcommand
+from .widgets import RowTreeview
 import config
 
+logger = logging.getLogger(__name__)
+
 
 def _create_selection_tree(
     parent: ttk.Frame,
@@ -31,7 +36,7 @@ def _create_selection_tree(
         Tuple of (treeview widget, scrollbar widget).
     """
     # Use extended selectmode for Ctrl/Shift multi-select
-    tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='extended')
+    tree = RowTreeview(parent, columns=columns, show='headings', selectmode='extended')
     
     # Configure data columns
     for i, (col, heading, width) in enumerate(zip(columns, headings, widths)):
@@ -42,225 +47,227 @@ def _create_selection_tree(
     
     scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
     scrollbar.grid(row=0, column=1, sticky="ns")
-    tree.configure(yscrollcommand=scrollbar.set)
+    tree.configure(yscrollcommand=lazy_yscrollcommand(tree, scrollbar))
     
     return tree, scrollbar
 
 
-def show_character_selection_dialog(
-    parent: tk.Tk,
-    source_char: SettingFile,
-    all_chars: List[SettingFile],
-    manager,
-    sort_tree_func: Callable,
-    notes_manager: Optional[NotesManager] = None
-) -> None:
-    """Show dialog to select specific characters to overwrite.
+# Per-kind settings for OverwriteSelectionDialog
+_SELECTION_KINDS = {
+    'char': {
+        'title': "Select Characters to Overwrite",
+        'noun': "character",
+        'columns': ('id', 'name', 'date', 'note'),
+        'headings': ('ID', 'Name', 'Last Modified', 'Note'),
+        'widths': (100, 200, 150, 150),
+        'size': (config.CHAR_SELECTION_DIALOG_WIDTH, config.CHAR_SELECTION_DIALOG_HEIGHT),
+    },
+    'account': {
+        'title': "Select Accounts to Overwrite",
+        'noun': "account",
+        'columns': ('id', 'date', 'note'),
+        'headings': ('ID', 'Last Modified', 'Note'),
+        'widths': (120, 180, 180),
+        'size': (config.ACCOUNT_SELECTION_DIALOG_WIDTH, config.ACCOUNT_SELECTION_DIALOG_HEIGHT),
+    },
+}
+
+
+class OverwriteSelectionDialog:
+    """Dialog to select specific characters or accounts to overwrite.
     
-    Args:
-        parent: Parent window.
-        source_char: Source character whose settings will be copied.
-        all_chars: List of all available characters.
-        manager: Settings manager instance.
-        sort_tree_func: Function for sorting treeview.
-        notes_manager: Optional notes manager for displaying notes.
+    The window is built once per kind and reused: closing it only hides it,
+    and show() repopulates it for a new source file.
     """
-    char_name = source_char.get_char_name()
-    
-    # Create selection dialog
-    dialog = tk.Toplevel(parent)
-    dialog.title("Select Characters to Overwrite")
-    dialog.transient(parent)
-    dialog.grab_set()
-    
-    # Main container with padding
-    main_container = ttk.Frame(dialog, padding="15")
-    main_container.pack(fill=tk.BOTH, expand=True)
-    
-    # Header
-    tk.Label(main_container, text=f"Copy From: {char_name}", 
-            font=("Segoe UI", 12, "bold"), foreground="#0066cc").pack(pady=(0, 5))
-    tk.Label(main_container, text="Select target characters (use Ctrl/Shift+Click for multiple):", 
-            font=("Segoe UI", 10)).pack(pady=(0, 5))
-    
-    # Treeview frame
-    tree_frame = ttk.Frame(main_container)
-    tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-    tree_frame.rowconfigure(0, weight=1)
-    tree_frame.columnconfigure(0, weight=1)
-    
-    # Create treeview with sortable columns
-    tree, scrollbar = _create_selection_tree(
-        tree_frame,
-        columns=('id', 'name', 'date', 'note'),
-        headings=('ID', 'Name', 'Last Modified', 'Note'),
-        widths=(100, 200, 150, 150),
-        sort_tree_func=sort_tree_func
-    )
-    
-    # Populate with other characters
-    target_chars = []
-    for char in all_chars:
-        if char.id != source_char.id:  # Skip source
-            mtime = char.path.stat().st_mtime
-            date_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            note = notes_manager.get_character_note(str(char.id)) if notes_manager else ""
-            
-            tree.insert('', 'end',
-                       values=(char.id, char.get_char_name(), date_str, note),
-                       tags=(str(char.id),))
-            target_chars.append(char)
     
-    # Sort by date initially - most recent first
-    sort_tree(tree, 'date', True)
-    
-    # Button frame
-    btn_frame = ttk.Frame(main_container)
-    btn_frame.pack(pady=(0, 0))
-    
-    def do_copy():
-        selections = tree.selection()
-        if not selections:
-            messagebox.showwarning("No Selection", "Please select at least one character.")
-            return
+    def __init__(
+        self,
+        parent: tk.Tk,
+        kind: str,
+        manager,
+        sort_tree_func: Callable,
+        notes_manager: Optional[NotesManager] = None
+    ):
+        """Initialize the selection dialog.
         
-        # Get selected characters by matching IDs
-        selected_ids = [int(tree.item(sel, 'values')[0]) for sel in selections]
-        targets = [c for c in target_chars if c.id in selected_ids]
+        Args:
+            parent: Parent window.
+            kind: 'char' or 'account'.
+            manager: Settings manager instance.
+            sort_tree_func: Function for sorting treeview.
+            notes_manager: Optional notes manager for displaying notes.
+        """
+        self.parent = parent
+        self.kind = kind
+        self.spec = _SELECTION_KINDS[kind]
+        self.manager = manager
+        self.notes_manager = notes_manager
+        self.source: Optional[SettingFile] = None
+        # Files that can be overwritten, by treeview iid (the file path string)
+        self.targets: Dict[str, SettingFile] = {}
+        # Result of the last background copy, picked up on <<CopyDone>>
+        self._copy_result: Optional[tuple] = None
         
-        # Build confirmation message with clear from/to lists
-        target_names = [c.get_char_name() for c in targets]
-        confirm_msg = f"Copy settings FROM:\n  • {char_name}\n\n"
-        confirm_msg += f"TO these {len(target_names)} character(s):\n"
-        for name in target_names:
-            confirm_msg += f"  • {name}\n"
-        confirm_msg += "\nThis will overwrite their current settings. Continue?"
+        # Create selection dialog
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()  # Shown by show() once populated
+        self.dialog.title(self.spec['title'])
+        self.dialog.transient(parent)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        self.dialog.bind('<<CopyDone>>', self._on_copy_done)
         
-        if not messagebox.askyesno("Confirm Overwrite", confirm_msg):
-            return
+        # Main container with padding
+        main_container = ttk.Frame(self.dialog, padding="15")
+        main_container.pack(fill=tk.BOTH, expand=True)
         
-        # Create temporary filtered list for copy operation
-        original_list = manager.char_list
-        manager.char_list = targets
-        total_copied = manager.copy_settings(source_char)
-        manager.char_list = original_list
+        # Header
+        self.source_label = tk.Label(main_container, font=("Segoe UI", 12, "bold"), foreground="#0066cc")
+        self.source_label.pack(pady=(0, 5))
+        tk.Label(main_container, text=f"Select target {self.spec['noun']}s (use Ctrl/Shift+Click for multiple):", 
+                font=("Segoe UI", 10)).pack(pady=(0, 5))
         
-        dialog.destroy()
-        messagebox.showinfo("Success", f"Settings copied to {len(targets)} character(s)!")
-    
-    ttk.Button(btn_frame, text="Copy to Selected", command=do_copy).pack(side=tk.LEFT, padx=5)
-    ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
-    
-    # Center dialog above main window
-    center_dialog(dialog, parent, config.CHAR_SELECTION_DIALOG_WIDTH, config.CHAR_SELECTION_DIALOG_HEIGHT)
-
-
-def show_account_selection_dialog(
-    parent: tk.Tk,
-    source_user: SettingFile,
-    all_users: List[SettingFile],
-    manager,
-    sort_tree_func: Callable,
-    notes_manager: Optional[NotesManager] = None
-) -> None:
-    """Show dialog to select specific accounts to overwrite.
-    
-    Args:
-        parent: Parent window.
-        source_user: Source account whose settings will be copied.
-        all_users: List of all available accounts.
-        manager: Settings manager instance.
-        sort_tree_func: Function for sorting treeview.
-        notes_manager: Optional notes manager for displaying notes.
-    """
-    user_id = source_user.id
-    
-    # Create selection dialog
-    dialog = tk.Toplevel(parent)
-    dialog.title("Select Accounts to Overwrite")
-    dialog.transient(parent)
-    dialog.grab_set()
-    
-    # Main container with padding
-    main_container = ttk.Frame(dialog, padding="15")
-    main_container.pack(fill=tk.BOTH, expand=True)
-    
-    # Header
-    tk.Label(main_container, text=f"Copy From: Account {user_id}", 
-            font=("Segoe UI", 12, "bold"), foreground="#0066cc").pack(pady=(0, 5))
-    tk.Label(main_container, text="Select target accounts (use Ctrl/Shift+Click for multiple):", 
-            font=("Segoe UI", 10)).pack(pady=(0, 5))
-    
-    # Treeview frame
-    tree_frame = ttk.Frame(main_container)
-    tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-    tree_frame.rowconfigure(0, weight=1)
-    tree_frame.columnconfigure(0, weight=1)
-    
-    # Create treeview with sortable columns
-    tree, scrollbar = _create_selection_tree(
-        tree_frame,
-        columns=('id', 'date', 'note'),
-        headings=('ID', 'Last Modified', 'Note'),
-        widths=(120, 180, 180),
-        sort_tree_func=sort_tree_func
-    )
-    
-    # Populate with other accounts
-    target_users = []
-    for user in all_users:
-        if user.id != user_id:  # Skip source
-            mtime = user.path.stat().st_mtime
-            date_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            note = notes_manager.get_account_note(str(user.id)) if notes_manager else ""
-            
-            tree.insert('', 'end',
-                       values=(user.id, date_str, note),
-                       tags=(str(user.id),))
-            target_users.append(user)
-    
-    # Sort by date initially - most recent first
-    sort_tree(tree, 'date', True)
+        # Treeview frame
+        tree_frame = ttk.Frame(main_container)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        tree_frame.rowconfigure(0, weight=1)
+        tree_frame.columnconfigure(0, weight=1)
+        
+        # Create treeview with sortable columns
+        self.tree, _ = _create_selection_tree(
+            tree_frame,
+            columns=self.spec['columns'],
+            headings=self.spec['headings'],
+            widths=self.spec['widths'],
+            sort_tree_func=sort_tree_func
+        )
+        
+        # Button frame
+        btn_frame = ttk.Frame(main_container)
+        btn_frame.pack(pady=(0, 0))
+        
+        ttk.Button(btn_frame, text="Copy to Selected", command=self._on_copy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self.hide).pack(side=tk.LEFT, padx=5)
     
-    # Button frame
-    btn_frame = ttk.Frame(main_container)
-    btn_frame.pack(pady=(0, 0))
+    def exists(self) -> bool:
+        """Check whether the dialog window still exists.
+        
+        Returns:
+            True if the window can be shown again, False otherwise.
+        """
+        return bool(self.dialog.winfo_exists())
+    
+    def _label(self, setting_file: SettingFile) -> str:
+        """Get the display label for a settings file."""
+        if self.kind == 'char':
+            return setting_file.get_char_name()
+        return f"Account {setting_file.id}"
+    
+    def show(self, source: SettingFile, files: List[SettingFile]) -> None:
+        """Show the dialog for a source file.
+        
+        The window is shown empty and the rows are filled in on the next idle
+        tick, so the dialog appears without waiting for the list to be built.
+        
+        Args:
+            source: Source file whose settings will be copied.
+            files: Files in the current profile; the source is skipped.
+        """
+        self.source = source
+        self.targets = {}
+        self.source_label.config(text=f"Copy From: {self._label(source)}")
+        
+        # Drop rows and selection left over from the last time the dialog was shown
+        self.tree.selection_set(())
+        clear_tree(self.tree)
+        
+        # Center dialog above main window
+        width, height = self.spec['size']
+        center_dialog(self.dialog, self.parent, width, height)
+        self.dialog.deiconify()
+        # A re-shown window isn't necessarily stacked above the main window
+        self.dialog.lift(self.parent)
+        self.dialog.grab_set()
+        self.dialog.focus_set()
+        
+        self.dialog.after_idle(self._populate, source, files)
     
-    def do_copy():
-        selections = tree.selection()
+    def _populate(self, source: SettingFile, files: List[SettingFile]) -> None:
+        """Fill the tree with the files that can be overwritten from source."""
+        # The dialog may have been reopened for another source in the meantime
+        if source is not self.source:
+            return
+        
+        if self.notes_manager is None:
+            notes = {}
+        elif self.kind == 'char':
+            notes = self.notes_manager.get_all_character_notes()
+        else:
+            notes = self.notes_manager.get_all_account_notes()
+        
+        # Populate with the other files
+        targets = [sf for sf in files if sf.id != source.id]
+        self.targets = {str(sf.path): sf for sf in targets}
+        rows = build_file_rows(targets, notes, self.kind == 'char')
+        
+        # Sort by date initially - most recent first
+        sort_rows(rows, self.tree['columns'], 'date', True)
+        update_sort_headings(self.tree, 'date', True)
+        set_tree_rows(self.tree, rows)
+        self.tree.yview_moveto(0)
+    
+    def hide(self) -> None:
+        """Hide the dialog so it can be shown again later."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
+    def _on_copy(self) -> None:
+        """Copy the source settings to the selected files."""
+        noun = self.spec['noun']
+        selections = self.tree.selection()
         if not selections:
-            messagebox.showwarning("No Selection", "Please select at least one account.")
+            messagebox.showwarning("No Selection", f"Please select at least one {noun}.")
             return
         
-        # Get selected accounts by matching IDs
-        selected_ids = [int(tree.item(sel, 'values')[0]) for sel in selections]
-        targets = [u for u in target_users if u.id in selected_ids]
+        # Look the selected rows up by iid (the file path)
+        targets = [self.targets[sel] for sel in selections if sel in self.targets]
         
         # Build confirmation message with clear from/to lists
-        target_ids = [str(u.id) for u in targets]
-        confirm_msg = f"Copy settings FROM:\n  • Account {user_id}\n\n"
-        confirm_msg += f"TO these {len(target_ids)} account(s):\n"
-        for tid in target_ids:
-            confirm_msg += f"  • Account {tid}\n"
+        confirm_msg = f"Copy settings FROM:\n  • {self._label(self.source)}\n\n"
+        confirm_msg += f"TO these {len(targets)} {noun}(s):\n"
+        for sf in targets:
+            confirm_msg += f"  • {self._label(sf)}\n"
         confirm_msg += "\nThis will overwrite their current settings. Continue?"
         
         if not messagebox.askyesno("Confirm Overwrite", confirm_msg):
             return
         
-        # Create temporary filtered list for copy operation
-        original_list = manager.user_list
-        manager.user_list = targets
-        total_copied = manager.copy_settings(source_user)
-        manager.user_list = original_list
+        self.hide()
         
-        dialog.destroy()
-        messagebox.showinfo("Success", f"Settings copied to {len(targets)} account(s)!")
-    
-    ttk.Button(btn_frame, text="Copy to Selected", command=do_copy).pack(side=tk.LEFT, padx=5)
-    ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        # Copy in the background so the window stays responsive for large selections
+        source = self.source
+        
+        def copy_thread():
+            try:
+                self.manager.copy_settings(source, targets=targets)
+                self._copy_result = ("Success", f"Settings copied to {len(targets)} {noun}(s)!")
+            except Exception as e:
+                logger.exception("Error copying settings")
+                self._copy_result = (None, f"Error copying settings: {e}")
+            finally:
+                self.dialog.event_generate('<<CopyDone>>', when='tail')
+        
+        threading.Thread(target=copy_thread, daemon=True).start()
     
-    # Center dialog above main window
-    center_dialog(dialog, parent, config.ACCOUNT_SELECTION_DIALOG_WIDTH, config.ACCOUNT_SELECTION_DIALOG_HEIGHT)
+    def _on_copy_done(self, event: Optional[tk.Event] = None) -> None:
+        """Report the result of a background copy."""
+        if self._copy_result is None:
+            return
+        title, message = self._copy_result
+        self._copy_result = None
+        if title:
+            messagebox.showinfo(title, message, parent=self.parent)
+        else:
+            messagebox.showerror("Copy Failed", message, parent=self.parent)
 
 
 def show_custom_paths_dialog(parent: tk.Tk, data_file, on_paths_changed: Optional[Callable] = None) -> None:
@@ -312,6 +319,8 @@ def show_custom_paths_dialog(parent: tk.Tk, data_file, on_paths_changed: Optiona
     
     def add_path():
         """Add a new custom path."""
+        # Lazy import: the file dialog is only needed on user action
+        from tkinter import filedialog
         directory = filedialog.askdirectory(
             parent=dialog,
             title="Select EVE Installation Directory",
@@ -326,11 +335,14 @@ def show_custom_paths_dialog(parent: tk.Tk, data_file, on_paths_changed: Optiona
                 messagebox.showwarning("Duplicate Path", "This path is already in the list.")
                 return
             
-            # Verify path contains EVE server folders
-            server_folders = [d for d in path_obj.iterdir() 
-                            if d.is_dir() and d.name.startswith('c_ccp_eve_')]
+            # Verify path contains EVE server folders; stop at the first one and
+            # only check the type of entries with a matching name
+            with os.scandir(path_obj) as entries:
+                has_server_folder = any(
+                    entry.name.startswith('c_ccp_eve_') and entry.is_dir() for entry in entries
+                )
             
-            if not server_folders:
+            if not has_server_folder:
                 result = messagebox.askyesno(
                     "No Server Folders Found",
                     f"No EVE server folders (c_ccp_eve_*) found in:\n{path_str}\n\n"
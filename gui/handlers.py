@@ -1,13 +1,13 @@
 """Event handlers for py-eve-settings GUI."""
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, simpledialog
-from typing import Optional, TYPE_CHECKING
+from tkinter import messagebox
+from typing import Dict, List, Optional, TYPE_CHECKING
 from pathlib import Path
-from datetime import datetime
 from utils import ValidationError, DataFileError
-from .dialogs import show_character_selection_dialog, show_account_selection_dialog
-from .helpers import sort_tree
+from utils.models import SettingFile
+from .dialogs import OverwriteSelectionDialog
+from .helpers import build_file_rows, request_sort, sort_rows, update_sort_headings, clear_tree, set_tree_rows, update_tree_row
 
 if TYPE_CHECKING:
     from .main_window import PyEveSettingsGUI
@@ -23,6 +23,16 @@ class EventHandlers:
             app: The main PyEveSettingsGUI application instance.
         """
         self.app = app
+        # Settings files shown in the current profile, in display order and by
+        # treeview iid (the file path string)
+        self._chars: List[SettingFile] = []
+        self._users: List[SettingFile] = []
+        self._char_by_iid: Dict[str, SettingFile] = {}
+        self._user_by_iid: Dict[str, SettingFile] = {}
+        # Overwrite selection dialogs by kind, built on first use and reused
+        self._overwrite_dialogs: Dict[str, OverwriteSelectionDialog] = {}
+        # Set while a profile redraw is queued for the next idle tick
+        self._redraw_scheduled = False
     
     def on_profile_selected(self, event: Optional[tk.Event] = None) -> None:
         """Handle profile selection change.
@@ -45,12 +55,21 @@ class EventHandlers:
                 if folder.name == profile_name:
                     self.app.selected_folder = folder
                     break
-            self.update_character_lists()
-            # Apply default sorting after updating lists
-            self.app._apply_default_sorting()
+            # Coalesce rapid selection changes into a single redraw of the
+            # most recently selected profile
+            if not self._redraw_scheduled:
+                self._redraw_scheduled = True
+                self.app.root.after_idle(self._redraw_profile)
+    
+    def _redraw_profile(self) -> None:
+        """Redraw the character and account lists for the selected profile."""
+        self._redraw_scheduled = False
+        self.update_character_lists()
     
     def select_custom_folder(self) -> None:
         """Browse for a custom settings folder."""
+        # Lazy import: the file dialog is only needed on user action
+        from tkinter import filedialog
         folder_path = filedialog.askdirectory(
             title="Select EVE Settings Folder",
             mustexist=True
@@ -83,12 +102,16 @@ class EventHandlers:
             # Fetch any new character names
             if character_ids:
                 self.app.api_cache.fetch_names_bulk(character_ids)
-                for char_id, name in self.app.api_cache.get_all_cached().items():
-                    self.app.data_file.save_character_name(str(char_id), name)
-                self.app.data_file.save()
+                names, invalid = self.app.api_cache.pop_changes()
+                if names or invalid:
+                    self.app.data_file.set_character_names({str(k): v for k, v in names.items()})
+                    self.app.data_file.add_invalid_ids(str(i) for i in invalid)
+                    self.app.data_file.save()
             
-            self.app.all_char_list = self.app.manager.char_list.copy()
-            self.app.all_user_list = self.app.manager.user_list.copy()
+            self.app.all_char_list = self.app.manager.char_list
+            self.app.all_user_list = self.app.manager.user_list
+            self.app._cache_server_data()
+            self.app._index_files_by_folder()
             
             # Add to profiles listbox before "Custom..."
             size = self.app.profiles_listbox.size()
@@ -97,54 +120,55 @@ class EventHandlers:
         # Set the selected folder and update view
         self.app.selected_folder = custom_folder
         self.update_character_lists()
-        # Apply default sorting after updating lists
-        self.app._apply_default_sorting()
     
     def update_character_lists(self) -> None:
-        """Update character and account lists based on selected profile."""
+        """Update character and account lists based on selected profile.
+        
+        Rows are ordered by the default sorting preference and rendered lazily.
+        """
         # Update path display
         if self.app.selected_folder:
             self.app.path_var.set(str(self.app.selected_folder))
         
-        # Filter by selected folder
-        filtered_chars = [
-            sf for sf in self.app.all_char_list 
-            if self.app.manager.file_to_folder.get(sf.path) == self.app.selected_folder
-        ]
-        filtered_users = [
-            sf for sf in self.app.all_user_list 
-            if self.app.manager.file_to_folder.get(sf.path) == self.app.selected_folder
-        ]
-        
-        # Update characters treeview
-        self.app.chars_tree.delete(*self.app.chars_tree.get_children())
-        for char in filtered_chars:
-            # Skip invalid characters
-            if self.app.api_cache.is_invalid(char.id):
-                continue
-            
-            mtime = char.path.stat().st_mtime
-            date_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            note = self.app.notes_manager.get_character_note(str(char.id))
-            
-            self.app.chars_tree.insert('', 'end', 
-                                      values=(char.id, char.get_char_name(), date_str, note),
-                                      tags=(str(char.id),))
-        
-        # Update accounts treeview
-        self.app.accounts_tree.delete(*self.app.accounts_tree.get_children())
-        for user in filtered_users:
-            mtime = user.path.stat().st_mtime
-            date_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            note = self.app.notes_manager.get_account_note(str(user.id))
-            
-            self.app.accounts_tree.insert('', 'end',
-                                         values=(user.id, date_str, note),
-                                         tags=(str(user.id),))
-        
-        # Store filtered lists for copy operation
-        self.app.manager.char_list = filtered_chars
-        self.app.manager.user_list = filtered_users
+        # Look up the selected folder's files (copied, as they are sorted below)
+        filtered_chars = list(self.app.chars_by_folder.get(self.app.selected_folder, ()))
+        filtered_users = list(self.app.users_by_folder.get(self.app.selected_folder, ()))
+        
+        column, reverse = self.app._get_default_sort()
+        
+        # Date ordering uses the cached mtimes, so rows are built already in
+        # order and need no sorting by their formatted date strings
+        if column == 'date':
+            filtered_chars.sort(key=lambda sf: sf.mtime, reverse=reverse)
+            filtered_users.sort(key=lambda sf: sf.mtime, reverse=reverse)
+        
+        # Fetch all notes once rather than looking each row up individually
+        char_notes = self.app.notes_manager.get_all_character_notes()
+        account_notes = self.app.notes_manager.get_all_account_notes()
+        
+        # Build rows, skipping invalid characters
+        is_invalid = self.app.api_cache.is_invalid
+        char_rows = build_file_rows((c for c in filtered_chars if not is_invalid(c.id)), char_notes, True)
+        user_rows = build_file_rows(filtered_users, account_notes, False)
+        
+        # Sort rows by the default sorting preference, then hand them to the
+        # tree; only the visible part is rendered, the rest as the user scrolls
+        for tree, rows in ((self.app.chars_tree, char_rows), (self.app.accounts_tree, user_rows)):
+            clear_tree(tree)
+            # For accounts tree, only id and date are available
+            if column in tree['columns']:
+                if column != 'date':
+                    sort_rows(rows, tree['columns'], column, reverse)
+                update_sort_headings(tree, column, reverse)
+            set_tree_rows(tree, rows)
+        
+        # Keep the profile's files for the copy operations; the manager's
+        # lists stay the full, unfiltered model
+        self._chars = filtered_chars
+        self._users = filtered_users
+        # Rows are keyed by file path (see build_file_rows)
+        self._char_by_iid = {str(c.path): c for c in filtered_chars}
+        self._user_by_iid = {str(u.path): u for u in filtered_users}
     
     def edit_char_note(self) -> None:
         """Edit note for selected character."""
@@ -153,19 +177,15 @@ class EventHandlers:
             messagebox.showwarning("No Selection", "Please select a character first.")
             return
         
-        item = selection[0]
-        values = self.app.chars_tree.item(item, 'values')
-        char_id = int(values[0])
-        char_name = values[1]
-        
-        char = next((c for c in self.app.manager.char_list if c.id == char_id), None)
+        char = self._char_by_iid.get(selection[0])
         if not char:
             return
         
-        current_note = self.app.notes_manager.get_character_note(str(char.id))
+        current_note = self.app.notes_manager.get_character_note(char.id_str)
+        from tkinter import simpledialog
         new_note = simpledialog.askstring(
             "Edit Character Note",
-            f"Enter note for {char_name} (max 20 characters):",
+            f"Enter note for {char.get_char_name()} (max 20 characters):",
             initialvalue=current_note,
             parent=self.app.root
         )
@@ -173,10 +193,14 @@ class EventHandlers:
         if new_note is not None:
             new_note = new_note[:20]
             try:
-                self.app.notes_manager.set_character_note(str(char.id), new_note)
-                self.app.data_file.set_character_note(str(char.id), new_note)
-                self.app.data_file.save()
-                self.update_character_lists()
+                self.app.notes_manager.set_character_note(char.id_str, new_note)
+                # Skip rewriting the data file when the note didn't change
+                if self.app.data_file.set_character_note(char.id_str, new_note):
+                    self.app.data_file.save()
+                # Only this row changed, so update it in place
+                notes = {char.id_str: self.app.notes_manager.get_character_note(char.id_str)}
+                iid, values = build_file_rows([char], notes, True)[0]
+                update_tree_row(self.app.chars_tree, iid, values)
             except (ValidationError, DataFileError) as e:
                 messagebox.showerror("Error Saving Note", str(e))
     
@@ -187,18 +211,15 @@ class EventHandlers:
             messagebox.showwarning("No Selection", "Please select an account first.")
             return
         
-        item = selection[0]
-        values = self.app.accounts_tree.item(item, 'values')
-        user_id = int(values[0])
-        
-        user = next((u for u in self.app.manager.user_list if u.id == user_id), None)
+        user = self._user_by_iid.get(selection[0])
         if not user:
             return
         
-        current_note = self.app.notes_manager.get_account_note(str(user.id))
+        current_note = self.app.notes_manager.get_account_note(user.id_str)
+        from tkinter import simpledialog
         new_note = simpledialog.askstring(
             "Edit Account Note",
-            f"Enter note for account {user_id} (max 20 characters):",
+            f"Enter note for account {user.id} (max 20 characters):",
             initialvalue=current_note,
             parent=self.app.root
         )
@@ -206,108 +227,70 @@ class EventHandlers:
         if new_note is not None:
             new_note = new_note[:20]
             try:
-                self.app.notes_manager.set_account_note(str(user.id), new_note)
-                self.app.data_file.set_account_note(str(user.id), new_note)
-                self.app.data_file.save()
-                self.update_character_lists()
+                self.app.notes_manager.set_account_note(user.id_str, new_note)
+                # Skip rewriting the data file when the note didn't change
+                if self.app.data_file.set_account_note(user.id_str, new_note):
+                    self.app.data_file.save()
+                # Only this row changed, so update it in place
+                notes = {user.id_str: self.app.notes_manager.get_account_note(user.id_str)}
+                iid, values = build_file_rows([user], notes, False)[0]
+                update_tree_row(self.app.accounts_tree, iid, values)
             except (ValidationError, DataFileError) as e:
                 messagebox.showerror("Error Saving Note", str(e))
     
-    def char_overwrite_all(self) -> None:
-        """Overwrite settings to all characters in current profile."""
-        selection = self.app.chars_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a source character first.")
-            return
-        
-        item = selection[0]
-        values = self.app.chars_tree.item(item, 'values')
-        char_id = int(values[0])
-        char_name = values[1]
-        
-        source_char = next((c for c in self.app.manager.char_list if c.id == char_id), None)
-        if not source_char:
-            return
+    def overwrite(self, kind: str, mode: str) -> None:
+        """Overwrite settings from the selected character or account.
         
-        result = messagebox.askyesno(
-            "Confirm Overwrite All",
-            f"Copy settings from {char_name} to ALL characters in this profile?\n\n"
-            f"This will affect {len(self.app.manager.char_list)} character(s)."
-        )
+        Args:
+            kind: 'char' or 'account'.
+            mode: 'all' to copy to every file of that kind in the current
+                profile, 'select' to choose the targets in a dialog.
+        """
+        if kind == 'char':
+            tree, files, by_iid, noun = self.app.chars_tree, self._chars, self._char_by_iid, "character"
+        else:
+            tree, files, by_iid, noun = self.app.accounts_tree, self._users, self._user_by_iid, "account"
         
-        if result:
-            total_copied = self.app.manager.copy_settings(source_char)
-            messagebox.showinfo("Success", f"Settings copied to {total_copied} file(s)!")
-    
-    def account_overwrite_all(self) -> None:
-        """Overwrite settings to all accounts in current profile."""
-        selection = self.app.accounts_tree.selection()
+        selection = tree.selection()
         if not selection:
-            messagebox.showwarning("No Selection", "Please select a source account first.")
+            messagebox.showwarning("No Selection", f"Please select a source {noun} first.")
             return
         
-        item = selection[0]
-        values = self.app.accounts_tree.item(item, 'values')
-        user_id = int(values[0])
+        source = by_iid.get(selection[0])
+        if not source:
+            return
         
-        source_user = next((u for u in self.app.manager.user_list if u.id == user_id), None)
-        if not source_user:
+        if mode == 'select':
+            self._show_overwrite_dialog(kind, source, files)
             return
         
+        label = source.get_char_name() if kind == 'char' else f"account {source.id}"
         result = messagebox.askyesno(
             "Confirm Overwrite All",
-            f"Copy settings from account {user_id} to ALL accounts in this profile?\n\n"
-            f"This will affect {len(self.app.manager.user_list)} account(s)."
+            f"Copy settings from {label} to ALL {noun}s in this profile?\n\n"
+            f"This will affect {len(files)} {noun}(s)."
         )
         
         if result:
-            total_copied = self.app.manager.copy_settings(source_user)
+            total_copied = self.app.manager.copy_settings(source, targets=files)
             messagebox.showinfo("Success", f"Settings copied to {total_copied} file(s)!")
     
-    def char_overwrite_select(self) -> None:
-        """Select specific characters to overwrite."""
-        selection = self.app.chars_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a source character first.")
-            return
-        
-        item = selection[0]
-        values = self.app.chars_tree.item(item, 'values')
-        char_id = int(values[0])
-        
-        source_char = next((c for c in self.app.manager.char_list if c.id == char_id), None)
-        if not source_char:
-            return
-        
-        show_character_selection_dialog(
-            self.app.root, 
-            source_char, 
-            self.app.manager.char_list,
-            self.app.manager,
-            sort_tree,
-            self.app.notes_manager
-        )
-    
-    def account_overwrite_select(self) -> None:
-        """Select specific accounts to overwrite."""
-        selection = self.app.accounts_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a source account first.")
-            return
-        
-        item = selection[0]
-        values = self.app.accounts_tree.item(item, 'values')
-        user_id = int(values[0])
+    def _show_overwrite_dialog(self, kind: str, source: SettingFile, files: List[SettingFile]) -> None:
+        """Show the overwrite selection dialog for a kind, reusing it if already built.
         
-        source_user = next((u for u in self.app.manager.user_list if u.id == user_id), None)
-        if not source_user:
-            return
-        
-        show_account_selection_dialog(
-            self.app.root,
-            source_user,
-            self.app.manager.user_list,
-            self.app.manager,
-            sort_tree,
-            self.app.notes_manager
-        )
+        Args:
+            kind: 'char' or 'account'.
+            source: Source file whose settings will be copied.
+            files: Files in the current profile.
+        """
+        dialog = self._overwrite_dialogs.get(kind)
+        if dialog is None or not dialog.exists():
+            dialog = OverwriteSelectionDialog(
+                self.app.root,
+                kind,
+                self.app.manager,
+                request_sort,
+                self.app.notes_manager
+            )
+            self._overwrite_dialogs[kind] = dialog
+        dialog.show(source, files)
@@ -4,61 +4,276 @@ Helper functions for GUI operations
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+import config
 
+if TYPE_CHECKING:
+    from .widgets import RowTreeview
 
-def sort_tree(tree: ttk.Treeview, col: str, reverse: bool):
-    """Sort treeview by column and update header with arrow indicator"""
-    # Get all items
-    items = [(tree.set(child, col), child) for child in tree.get_children('')]
+
+# Treeview column headings shown by sort_tree
+COLUMN_NAMES = {
+    'id': 'ID',
+    'name': 'Name',
+    'date': 'Last Modified',
+    'note': 'Note'
+}
+
+
+def _row_sort_key(col: str, index: int) -> Callable[[Tuple[str, Sequence[str]]], object]:
+    """Return the sort key for (iid, values) rows on the column at index
     
-    # Sort items - handle numeric IDs specially
+    Each key is a single function (sort calls it once per row) that reads
+    the value straight from the row, with no nested helper calls.
+    """
     if col == 'id':
-        items.sort(key=lambda x: int(x[0]) if x[0].isdigit() else 0, reverse=reverse)
+        return lambda row: int(row[1][index]) if row[1][index].isdigit() else 0
     elif col == 'date':
-        items.sort(key=lambda x: x[0], reverse=reverse)
-    else:
-        items.sort(key=lambda x: x[0].lower(), reverse=reverse)
-    
-    # Rearrange items in sorted positions
-    for index, (val, child) in enumerate(items):
-        tree.move(child, '', index)
-    
+        return lambda row: row[1][index]
+    return lambda row: row[1][index].lower()
+
+
+def update_sort_headings(tree: 'RowTreeview', col: str, reverse: bool):
+    """Show the sort arrow on a column header and make it toggle on click"""
     # Update all column headers to remove arrows
-    column_names = {
-        'id': 'ID',
-        'name': 'Name',
-        'date': 'Last Modified',
-        'note': 'Note'
-    }
-    
     for column in tree['columns']:
-        if column in column_names:
+        if column in COLUMN_NAMES:
             # Remove any existing arrows from the header
-            base_text = column_names[column]
-            tree.heading(column, text=base_text)
+            tree.heading(column, text=COLUMN_NAMES[column])
     
     # Add arrow to the sorted column
     arrow = ' ▼' if reverse else ' ▲'
-    tree.heading(col, text=column_names.get(col, col) + arrow)
+    tree.heading(col, text=COLUMN_NAMES.get(col, col) + arrow)
     
     # Update heading to reverse sort next time
-    tree.heading(col, command=lambda: sort_tree(tree, col, not reverse))
+    tree.heading(col, command=lambda: request_sort(tree, col, not reverse))
+    
+    # Remember the order of the backing rows for update_tree_row
+    tree.sort_order = (col, reverse)
+
+
+def build_file_rows(files: Iterable, notes: Dict[str, str], with_name: bool) -> List[Tuple[str, Tuple]]:
+    """Build (iid, values) treeview rows for settings files
+    
+    Rows are keyed by the file path (IDs are not unique: copies and backups
+    of a settings file share its ID) and hold (id, [name,] date, note).
+    
+    Args:
+        files: SettingFile objects to show, in display order.
+        notes: Notes by file ID string.
+        with_name: Include the character name column.
+    """
+    if with_name:
+        return [
+            (str(sf.path), (sf.id_str, sf.get_char_name(), sf.date_str, notes.get(sf.id_str, "")))
+            for sf in files
+        ]
+    return [(str(sf.path), (sf.id_str, sf.date_str, notes.get(sf.id_str, ""))) for sf in files]
+
+
+def sort_rows(rows: List[Tuple[str, Sequence]], columns: Sequence[str], col: str, reverse: bool):
+    """Sort (iid, values) rows in place the same way sort_tree orders a column"""
+    rows.sort(key=_row_sort_key(col, list(columns).index(col)), reverse=reverse)
+
+
+def sort_tree(tree: 'RowTreeview', col: str, reverse: bool):
+    """Sort treeview by column and update header with arrow indicator
+    
+    Sorts the tree's backing rows in Python and re-renders them, rather than
+    reading and moving every item through Tk.
+    """
+    sort_rows(tree.rows, tree['columns'], col, reverse)
+    render_rows(tree)
+    
+    update_sort_headings(tree, col, reverse)
+
+
+def schedule_redraw(tree: 'RowTreeview', key: str, callback: Callable):
+    """Run callback after TREE_REDRAW_DELAY, replacing any call pending under key
+    
+    Coalesces bursts of events (e.g. repeated heading clicks or scroll
+    events) into a single redraw.
+    """
+    pending = tree.pending_redraws
+    
+    after_id = pending.pop(key, None)
+    if after_id is not None:
+        tree.after_cancel(after_id)
+    
+    def run():
+        pending.pop(key, None)
+        callback()
+    
+    pending[key] = tree.after(config.TREE_REDRAW_DELAY, run)
+
+
+def request_sort(tree: 'RowTreeview', col: str, reverse: bool):
+    """Sort a treeview on the next redraw tick (for heading clicks)"""
+    schedule_redraw(tree, 'sort', lambda: sort_tree(tree, col, reverse))
+
+
+def delete_all_items(tree: ttk.Treeview):
+    """Delete every top-level treeview item in a single Tcl call"""
+    # Pass the Tcl children list straight back to delete without building a Python tuple
+    tree.tk.call(tree._w, 'delete', tree.tk.call(tree._w, 'children', ''))
 
 
-def center_window(window: tk.Tk):
-    """Center the window on the screen"""
-    window.update_idletasks()
-    width = window.winfo_width()
-    height = window.winfo_height()
+def clear_tree(tree: 'RowTreeview'):
+    """Remove all rows from a RowTreeview, including rows not yet rendered
+    
+    For plain treeviews, use delete_all_items.
+    """
+    tree.rows = []
+    tree.rendered = 0
+    tree.sort_order = None
+    delete_all_items(tree)
+
+
+def set_tree_rows(tree: 'RowTreeview', rows: List[Tuple[str, Sequence]]):
+    """Replace the rows backing a treeview and render them
+    
+    The full (iid, values) row list is kept in Python on the tree; only about
+    one screenful is inserted into Tk up front (see render_rows).
+    """
+    tree.rows = rows
+    render_rows(tree)
+
+
+def render_rows(tree: 'RowTreeview'):
+    """Re-render a row-backed treeview from its backing rows
+    
+    Inserts roughly one screenful of rows; further rows are inserted in
+    batches as the user scrolls towards the end (see lazy_yscrollcommand)
+    or all at once by load_pending_rows. Selected rows stay selected.
+    """
+    rows = tree.rows
+    selection = tree.selection()
+    
+    delete_all_items(tree)
+    tree.rendered = 0
+    
+    visible = max(config.LAZY_TREE_MIN_BATCH, tree.winfo_height() // config.TREEVIEW_ROW_HEIGHT)
+    
+    # Make sure previously selected rows are rendered so they can be reselected
+    if selection:
+        wanted = set(selection)
+        last_selected = max((i for i, (iid, _) in enumerate(rows) if iid in wanted), default=-1)
+        visible = max(visible, last_selected + 1)
+    
+    load_pending_rows(tree, visible)
+    
+    if selection:
+        still_present = [iid for iid in selection if tree.exists(iid)]
+        if still_present:
+            tree.selection_set(*still_present)
+
+
+def load_pending_rows(tree: 'RowTreeview', count: int = 0):
+    """Insert up to count not-yet-rendered rows (all of them if count is 0)"""
+    rows = tree.rows
+    if not rows:
+        return
+    
+    start = tree.rendered
+    end = len(rows) if count <= 0 else min(len(rows), start + count)
+    
+    # Call the Tcl command directly: Treeview.insert re-formats its options
+    # into a Tcl string on every call, while a values tuple converts natively
+    call, widget = tree.tk.call, tree._w
+    for iid, values in rows[start:end]:
+        call(widget, 'insert', '', 'end', '-id', iid, '-values', values)
+    tree.rendered = end
+
+
+def _sorted_insert_index(rows: List[Tuple[str, Sequence]], row: Tuple[str, Sequence],
+                         key: Callable, reverse: bool) -> int:
+    """Binary search for where row goes in rows sorted by key (after equal keys)"""
+    row_key = key(row)
+    lo, hi = 0, len(rows)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        mid_key = key(rows[mid])
+        if (row_key > mid_key) if reverse else (row_key < mid_key):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def update_tree_row(tree: 'RowTreeview', iid: str, values: Sequence):
+    """Replace one row's values without re-rendering the whole treeview
+    
+    If the tree is sorted, the row is moved to its new sorted position by
+    binary search; the Tk item is updated, moved, added or removed so the
+    rendered rows stay the first rows of the backing list.
+    """
+    rows = tree.rows
+    index = next((i for i, (row_iid, _) in enumerate(rows) if row_iid == iid), None)
+    if index is None:
+        return
+    
+    row = (iid, values)
+    rendered = tree.rendered
+    was_rendered = index < rendered
+    
+    sort = tree.sort_order
+    if sort is None:
+        rows[index] = row
+        new_index = index
+    else:
+        col, reverse = sort
+        rows.pop(index)
+        if was_rendered:
+            rendered -= 1
+        new_index = _sorted_insert_index(rows, row, _row_sort_key(col, list(tree['columns']).index(col)), reverse)
+        rows.insert(new_index, row)
+    
+    if new_index <= rendered:
+        if was_rendered:
+            tree.item(iid, values=values)
+            # Tk resolves the move index before taking the item out of its
+            # old place, so moving down needs one more
+            tree.move(iid, '', new_index + 1 if new_index > index else new_index)
+        else:
+            tree.insert('', new_index, iid=iid, values=values)
+        if sort is not None or not was_rendered:
+            rendered += 1
+    elif was_rendered:
+        tree.delete(iid)
+    tree.rendered = rendered
+
+
+def lazy_yscrollcommand(tree: 'RowTreeview', scrollbar: ttk.Scrollbar) -> Callable:
+    """Build a yscrollcommand that updates the scrollbar and renders more rows near the end"""
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        rows = tree.rows
+        if rows and tree.rendered < len(rows) and float(last) >= config.LAZY_TREE_LOAD_THRESHOLD:
+            schedule_redraw(tree, 'load', lambda: load_pending_rows(tree, config.LAZY_TREE_MIN_BATCH))
+    return on_scroll
+
+
+def center_window(window: tk.Tk, width: int = 0, height: int = 0):
+    """Center the window on the screen
+    
+    When the window's size is known, pass it in to avoid forcing a layout
+    pass just to read the size back.
+    """
+    if not (width and height):
+        window.update_idletasks()
+        width = window.winfo_width()
+        height = window.winfo_height()
     x = (window.winfo_screenwidth() // 2) - (width // 2)
     y = (window.winfo_screenheight() // 2) - (height // 2)
     window.geometry(f'{width}x{height}+{x}+{y}')
 
 
 def center_dialog(dialog: tk.Toplevel, parent: tk.Tk, width: int, height: int):
-    """Center a dialog above its parent window"""
-    dialog.update_idletasks()
+    """Center a dialog above its parent window
     
+    The dialog's size is given, so only the (already mapped) parent's
+    geometry is read and no layout pass is forced on the dialog.
+    """
     # Get parent window position and size
     main_x = parent.winfo_x()
     main_y = parent.winfo_y()
@@ -1,24 +1,32 @@
 """Main GUI window for py-eve-settings."""
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
 import threading
-from typing import Optional, List
+import time
+from collections import defaultdict
+from functools import partial
+from typing import Optional, List, Tuple, Dict
 from pathlib import Path
 
 from data import DataFile, WindowSettings, NotesManager
-from esi import ESICache, ESIClient
 from utils import EVEPathResolver, BackupManager
 from utils.core import SettingsManager
 from utils.models import SettingFile
 from utils import DataFileError, PlatformNotSupportedError, ValidationError
+import config
 from .widgets import create_main_layout, create_menu_bar
 from .handlers import EventHandlers
-from .helpers import center_window, sort_tree
-from .dialogs import show_custom_paths_dialog
-# Lazy import to avoid initialization issues
+from .helpers import center_window, sort_tree, clear_tree
+# Lazy imports to keep startup light:
+# from esi import ESICache, ESIClient
+# from .dialogs import show_custom_paths_dialog
 # from .backup_window import show_backup_manager
 
+logger = logging.getLogger(__name__)
+
 
 class PyEveSettingsGUI:
     """Main GUI application for py-eve-settings."""
@@ -35,10 +43,20 @@ class PyEveSettingsGUI:
         self.settings_folders: List[Path] = []
         self.all_char_list: List[SettingFile] = []
         self.all_user_list: List[SettingFile] = []
-        self.loading = True
+        # all_char_list/all_user_list bucketed by settings folder
+        self.chars_by_folder: Dict[Path, List[SettingFile]] = {}
+        self.users_by_folder: Dict[Path, List[SettingFile]] = {}
         self.selected_folder: Optional[Path] = None
         self.resize_timer: Optional[str] = None
+        self._backup_result: Optional[tuple] = None
         self.sash_timer: Optional[str] = None
+        self._last_configure_time = 0.0
+        self._last_saved_state: Optional[tuple] = None
+        self._sorted_server_names: List[str] = []
+        # Per-server (settings_folders, all_char_list, all_user_list)
+        self._server_cache: Dict[str, tuple] = {}
+        # Results handed from the loader thread to the main thread
+        self._load_queue: queue.Queue = queue.Queue()
         
         # Initialize application layers
         self._init_data_layer()
@@ -49,36 +67,26 @@ class PyEveSettingsGUI:
         
         # Center window only if no saved position
         if self.window_settings.should_center():
-            center_window(self.root)
+            center_window(self.root, self.window_settings.width, self.window_settings.height)
         
-        # Start loading data in background
-        self.root.after(100, self.start_loading_data)
+        # Start loading data in background as soon as the event loop is idle
+        self.root.after_idle(self.start_loading_data)
     
     def _configure_fonts(self) -> None:
-        """Configure default fonts for the entire application."""
-        import tkinter.font as tkfont
-        
-        # Get the default font and increase its size
-        default_font = tkfont.nametofont("TkDefaultFont")
-        default_font.configure(size=10)
-        
-        # Configure text font (used in Entry, Text, etc.)
-        text_font = tkfont.nametofont("TkTextFont")
-        text_font.configure(size=10)
-        
-        # Configure fixed-width font (used in monospace displays)
-        fixed_font = tkfont.nametofont("TkFixedFont")
-        fixed_font.configure(size=10)
-        
-        # Configure menu font
-        menu_font = tkfont.nametofont("TkMenuFont")
-        menu_font.configure(size=10)
-        
-        # Configure heading font for treeview headers
-        heading_font = tkfont.Font(family="Segoe UI", size=10, weight="normal")
-        style = ttk.Style()
-        style.configure("Treeview.Heading", font=heading_font)
-        style.configure("Treeview", font=("Segoe UI", 10), rowheight=38)
+        """Configure default fonts for the entire application.
+        
+        Named fonts and ttk styles are global to the Tk interpreter, so this
+        only needs to run once per application.
+        """
+        # Resize the standard named fonts (default, Entry/Text, monospace, menus)
+        # directly in Tcl instead of wrapping each one in a tkfont.Font object
+        for font_name in ('TkDefaultFont', 'TkTextFont', 'TkFixedFont', 'TkMenuFont'):
+            self.root.tk.call('font', 'configure', font_name, '-size', 10)
+        
+        # Configure treeview header and row fonts with plain font tuples
+        style = ttk.Style(self.root)
+        style.configure("Treeview.Heading", font=("Segoe UI", 10, "normal"))
+        style.configure("Treeview", font=("Segoe UI", 10), rowheight=config.TREEVIEW_ROW_HEIGHT)
     
     def _init_data_layer(self) -> None:
         """Initialize data persistence layer.
@@ -95,10 +103,14 @@ class PyEveSettingsGUI:
                 self.data_file.get_window_settings()
             )
             
+            # Split the character cache once; names go to the ESI cache in _init_managers
+            char_names, invalid_ids, char_notes = self.data_file.get_character_data()
+            self._startup_char_cache = (char_names, invalid_ids)
+            
             # Initialize notes manager
             self.notes_manager = NotesManager()
             self.notes_manager.load_from_dict(
-                self.data_file.get_character_notes(),
+                char_notes,
                 self.data_file.get_account_notes()
             )
         except DataFileError as e:
@@ -115,13 +127,14 @@ class PyEveSettingsGUI:
         Raises:
             SystemExit: If platform is not supported.
         """
+        # Lazy import: ESI networking is only needed once data loading starts
+        from esi import ESICache, ESIClient
+        
         try:
             # Initialize API cache
             self.api_cache = ESICache(ESIClient())
-            # Convert string keys to int for cache loading
-            char_names = {int(k): v for k, v in self.data_file.get_character_names().items()}
-            invalid_ids = {int(i) for i in self.data_file.get_invalid_ids()}
-            self.api_cache.load_cache(char_names, invalid_ids)
+            self.api_cache.load_cache(*self._startup_char_cache)
+            del self._startup_char_cache
             
             # Initialize path resolver with custom paths
             custom_paths = self.data_file.get_custom_paths()
@@ -137,7 +150,7 @@ class PyEveSettingsGUI:
                     self.current_server = 'Tranquility'
                 else:
                     # Fall back to first discovered server
-                    self.current_server = list(self.available_servers.keys())[0]
+                    self.current_server = next(iter(self.available_servers))
             else:
                 self.current_server = 'Tranquility'
             
@@ -206,8 +219,7 @@ class PyEveSettingsGUI:
         self.handlers = EventHandlers(self)
         
         # Populate server dropdown and set current selection
-        server_names = sorted(self.available_servers.keys()) if self.available_servers else ['Tranquility']
-        self.server_combo['values'] = server_names
+        self._refresh_server_names()
         self.server_var.set(self.current_server)
         
         # Connect server selection handler
@@ -216,14 +228,18 @@ class PyEveSettingsGUI:
         # Connect backup button handler
         self._widgets['backup_btn'].config(command=self._on_backup_profile)
         
+        # Background threads signal completion through virtual events
+        self.root.bind('<<BackupDone>>', self._on_backup_done)
+        self.root.bind('<<LoadingDone>>', self._on_loading_done)
+        
         # Connect event handlers to widgets
         self.profiles_listbox.bind('<<ListboxSelect>>', self.handlers.on_profile_selected)
         self._widgets['char_edit_btn'].config(command=self.handlers.edit_char_note)
-        self._widgets['char_overwrite_all_btn'].config(command=self.handlers.char_overwrite_all)
-        self._widgets['char_overwrite_select_btn'].config(command=self.handlers.char_overwrite_select)
+        self._widgets['char_overwrite_all_btn'].config(command=partial(self.handlers.overwrite, 'char', 'all'))
+        self._widgets['char_overwrite_select_btn'].config(command=partial(self.handlers.overwrite, 'char', 'select'))
         self._widgets['account_edit_btn'].config(command=self.handlers.edit_account_note)
-        self._widgets['account_overwrite_all_btn'].config(command=self.handlers.account_overwrite_all)
-        self._widgets['account_overwrite_select_btn'].config(command=self.handlers.account_overwrite_select)
+        self._widgets['account_overwrite_all_btn'].config(command=partial(self.handlers.overwrite, 'account', 'all'))
+        self._widgets['account_overwrite_select_btn'].config(command=partial(self.handlers.overwrite, 'account', 'select'))
         
         # Bind window resize/move event to save settings
         self.root.bind('<Configure>', self._handle_window_configure)
@@ -233,6 +249,15 @@ class PyEveSettingsGUI:
         # which fires when user releases mouse button after dragging
         self.paned_window.bind('<ButtonRelease-1>', self._handle_sash_moved)
     
+    def _refresh_server_names(self) -> None:
+        """Recompute the sorted server names and update the server dropdown.
+        
+        Call whenever available_servers changes.
+        """
+        # discover_servers() already returns servers ordered by name
+        self._sorted_server_names = list(self.available_servers) or ['Tranquility']
+        self.server_combo['values'] = self._sorted_server_names
+    
     def _handle_window_configure(self, event: tk.Event) -> None:
         """Handle window resize and move events and save the new settings.
         
@@ -245,12 +270,22 @@ class PyEveSettingsGUI:
         if event.widget != self.root:
             return
         
+        # Minimized/hidden windows report bogus geometry; don't schedule a save
+        if self.root.wm_state() in ('iconic', 'withdrawn'):
+            return
+        
         # Cancel previous timer if it exists
         if self.resize_timer is not None:
             self.root.after_cancel(self.resize_timer)
         
-        # Set a new timer to save the size after 500ms of no resizing
-        self.resize_timer = self.root.after(500, self._save_window_state)
+        # Back off further while the window is actively being dragged/resized
+        now = time.monotonic()
+        dragging = (now - self._last_configure_time) < 0.1
+        self._last_configure_time = now
+        delay = config.WINDOW_SAVE_DRAG_DELAY if dragging else config.WINDOW_SAVE_DELAY
+        
+        # Set a new timer to save the size once resizing settles
+        self.resize_timer = self.root.after(delay, self._save_window_state)
     
     def _handle_sash_moved(self, event: tk.Event) -> None:
         """Handle sash movement in the PanedWindow.
@@ -283,32 +318,44 @@ class PyEveSettingsGUI:
         self.sash_timer = None
     
     def _save_window_state(self) -> None:
-        """Save the current window size, position, and panel sash positions."""
+        """Save the current window size, position, and panel sash positions.
+        
+        Skips the disk write when nothing changed since the last save, since
+        Tk also fires <Configure> for events that don't move or resize.
+        """
+        self.resize_timer = None
+        
         width = self.root.winfo_width()
         height = self.root.winfo_height()
         x_pos = self.root.winfo_x()
         y_pos = self.root.winfo_y()
         
-        # Update window settings object
-        self.window_settings.update(width, height, x_pos, y_pos)
-        
-        # Save window geometry to data file
-        self.data_file.set_window_settings(width, height, x_pos, y_pos)
-        
-        # Save sash positions (only if they're valid/reasonable values)
+        # Read sash positions (only keep them if they're valid/reasonable values)
+        sash_positions = None
         try:
             sash0 = self.paned_window.sashpos(0)
             sash1 = self.paned_window.sashpos(1)
             # Only save if positions are reasonable (> 50 pixels to avoid saving uninitialized values)
             if sash0 > 50 and sash1 > 50:
-                self.data_file.set_sash_positions([sash0, sash1])
+                sash_positions = (sash0, sash1)
         except Exception:
             # Silently ignore if sash positions can't be read
             pass
         
-        self.data_file.save()
+        state = (width, height, x_pos, y_pos, sash_positions)
+        if state == self._last_saved_state:
+            return
         
-        self.resize_timer = None
+        # Update window settings object
+        self.window_settings.update(width, height, x_pos, y_pos)
+        
+        # Save window geometry to data file
+        self.data_file.set_window_settings(width, height, x_pos, y_pos)
+        if sash_positions:
+            self.data_file.set_sash_positions(list(sash_positions))
+        
+        self.data_file.save()
+        self._last_saved_state = state
     
     def _on_server_changed(self, event: Optional[tk.Event] = None) -> None:
         """Handle server selection change.
@@ -324,77 +371,128 @@ class PyEveSettingsGUI:
             server_name_lower = selected_server.lower()
             self.path_resolver.server = server_name_lower
             
+            # Clear current data
+            self.profiles_listbox.delete(0, tk.END)
+            clear_tree(self.chars_tree)
+            clear_tree(self.accounts_tree)
+            self.path_var.set("")
+            
+            # Servers loaded earlier in this session are restored without a reload
+            if self._restore_server_data(selected_server):
+                self.on_loading_complete()
+                return
+            
             # Reload data for the new server
             self.status_label.config(text=f"Switching to {selected_server} server...", foreground="blue")
             self.progress.grid()  # Show progress bar
             self.progress.start(10)
             
-            # Clear current data
-            self.profiles_listbox.delete(0, tk.END)
-            self.chars_tree.delete(*self.chars_tree.get_children())
-            self.accounts_tree.delete(*self.accounts_tree.get_children())
-            self.path_var.set("")
-            
             # Reload in background
-            self.loading = True
-            self.root.after(100, self.start_loading_data)
+            self.root.after_idle(self.start_loading_data)
+    
+    def _cache_server_data(self) -> None:
+        """Remember the loaded folders and files for the current server.
+        
+        Lets _on_server_changed switch back to this server without
+        rediscovering folders, re-reading files or refetching names.
+        """
+        if not self.settings_folders:
+            return
+        
+        self._server_cache[self.current_server] = (
+            self.settings_folders,
+            self.all_char_list,
+            self.all_user_list,
+        )
+    
+    def _restore_server_data(self, server: str) -> bool:
+        """Restore previously loaded data for a server.
+        
+        Args:
+            server: Server display name.
+            
+        Returns:
+            True if cached data was restored, False if the server must be loaded.
+        """
+        cached = self._server_cache.get(server)
+        if cached is None:
+            return False
+        
+        self.settings_folders, self.all_char_list, self.all_user_list = cached
+        self.manager.settings_folders = self.settings_folders
+        self.manager.char_list = self.all_char_list
+        self.manager.user_list = self.all_user_list
+        return True
+    
+    def _index_files_by_folder(self) -> None:
+        """Bucket the loaded character and account files by settings folder.
+        
+        Lets profile switches look up a folder's files directly instead of
+        filtering every loaded file.
+        """
+        self.chars_by_folder = defaultdict(list)
+        self.users_by_folder = defaultdict(list)
+        for sf in self.all_char_list:
+            self.chars_by_folder[sf.folder].append(sf)
+        for sf in self.all_user_list:
+            self.users_by_folder[sf.folder].append(sf)
     
     def _on_backup_profile(self) -> None:
         """Handle backup button click."""
-        print("[DEBUG GUI] _on_backup_profile called")
+        logger.debug("_on_backup_profile called")
         
         # Check if a profile is selected
         selection = self.profiles_listbox.curselection()
-        print(f"[DEBUG GUI] Selection: {selection}")
+        logger.debug("Selection: %s", selection)
         
         if not selection:
-            print("[DEBUG GUI] No profile selected")
             self.backup_status_var.set("Please select a profile first")
             self._widgets['backup_status_label'].config(foreground="red")
             return
         
         # Get selected profile folder
         folder_index = selection[0]
-        print(f"[DEBUG GUI] Folder index: {folder_index}, total folders: {len(self.settings_folders)}")
         
         if folder_index >= len(self.settings_folders):
-            print("[DEBUG GUI] Invalid folder index")
+            logger.debug("Invalid folder index %s (total folders: %s)", folder_index, len(self.settings_folders))
             self.backup_status_var.set("Invalid profile selection")
             self._widgets['backup_status_label'].config(foreground="red")
             return
         
         profile_folder = self.settings_folders[folder_index]
-        print(f"[DEBUG GUI] Profile folder: {profile_folder}")
         
         # Update backup manager base path
         base_path = self.path_resolver.get_base_path()
-        print(f"[DEBUG GUI] Base path: {base_path}")
+        logger.debug("Profile folder: %s, base path: %s", profile_folder, base_path)
         
         if not base_path:
-            print("[DEBUG GUI] Could not determine base path")
             self.backup_status_var.set("Could not determine base path")
             self._widgets['backup_status_label'].config(foreground="red")
             return
         
-        print("[DEBUG GUI] Setting backup manager base path")
         self.backup_manager.set_base_path(base_path)
         
-        # Show in-progress status
-        print("[DEBUG GUI] Updating UI to show 'Creating backup...'")
+        # Show in-progress status; the thread is started from an idle callback
+        # so Tk paints the status change without forcing update_idletasks()
         self.backup_status_var.set("Creating backup...")
         self._widgets['backup_status_label'].config(foreground="blue")
-        self.root.update_idletasks()
+        self.root.after_idle(self._start_backup_thread, profile_folder)
+    
+    def _start_backup_thread(self, profile_folder: Path) -> None:
+        """Create a backup of a profile folder in a background thread.
         
-        # Store result in instance variable for periodic checking
+        Generates a <<BackupDone>> virtual event when finished.
+        
+        Args:
+            profile_folder: Path to the settings folder to backup.
+        """
+        # Store result in instance variable for the main thread to pick up
         self._backup_result = None
         
-        # Create backup in background thread
         def backup_thread():
-            print("[DEBUG GUI] Backup thread started", flush=True)
             try:
-                print("[DEBUG GUI] Calling backup_manager.create_backup...", flush=True)
                 success, message, backup_path = self.backup_manager.create_backup(profile_folder)
-                print(f"[DEBUG GUI] Backup result: success={success}, message={message}", flush=True)
+                logger.debug("Backup result: success=%s, message=%s", success, message)
                 
                 # Store result for main thread to pick up
                 if success:
@@ -404,38 +502,30 @@ class PyEveSettingsGUI:
                     status_msg = f"✗ Failed: {message}"
                     self._backup_result = (status_msg, "red")
                 
-                print(f"[DEBUG GUI] Result stored: {self._backup_result}", flush=True)
-                
             except Exception as e:
-                print(f"[DEBUG GUI] Exception in backup thread: {type(e).__name__}: {e}", flush=True)
-                import traceback
-                traceback.print_exc()
+                logger.exception("Exception in backup thread")
                 error_msg = f"✗ Error: {str(e)[:50]}"
                 self._backup_result = (error_msg, "red")
             finally:
-                print("[DEBUG GUI] Backup thread finishing", flush=True)
-        
-        # Start checking for result
-        def check_backup_result():
-            print(f"[DEBUG GUI] Checking backup result: {self._backup_result}", flush=True)
-            if self._backup_result is not None:
-                status_msg, color = self._backup_result
-                print(f"[DEBUG GUI] Updating UI: {status_msg} ({color})", flush=True)
-                self.backup_status_var.set(status_msg)
-                self._widgets['backup_status_label'].config(foreground=color)
-                self._backup_result = None  # Reset
-                print("[DEBUG GUI] UI updated successfully", flush=True)
-            else:
-                # Keep checking every 100ms
-                self.root.after(100, check_backup_result)
+                # Notify the main thread once instead of polling for the result
+                self.root.event_generate('<<BackupDone>>', when='tail')
         
-        print("[DEBUG GUI] Starting backup thread", flush=True)
         thread = threading.Thread(target=backup_thread, daemon=True)
         thread.start()
+    
+    def _on_backup_done(self, event: Optional[tk.Event] = None) -> None:
+        """Update the backup status label once the backup thread finishes.
         
-        # Start checking for results after 100ms
-        self.root.after(100, check_backup_result)
-        print("[DEBUG GUI] Backup thread started, periodic check scheduled", flush=True)
+        Args:
+            event: The <<BackupDone>> virtual event.
+        """
+        if self._backup_result is None:
+            return
+        
+        status_msg, color = self._backup_result
+        self.backup_status_var.set(status_msg)
+        self._widgets['backup_status_label'].config(foreground=color)
+        self._backup_result = None  # Reset
     
     def _on_exit(self) -> None:
         """Handle Exit menu command."""
@@ -449,10 +539,14 @@ class PyEveSettingsGUI:
     
     def _on_manage_paths(self) -> None:
         """Handle Manage Paths menu command."""
+        from .dialogs import show_custom_paths_dialog
         show_custom_paths_dialog(self.root, self.data_file, self._on_custom_paths_changed)
     
     def _on_custom_paths_changed(self) -> None:
         """Handle custom paths being changed - reinitialize path resolver and reload data."""
+        # Installations may have changed, so previously loaded servers are stale
+        self._server_cache.clear()
+        
         # Reinitialize path resolver with new custom paths
         custom_paths = self.data_file.get_custom_paths()
         self.path_resolver = EVEPathResolver(custom_paths=custom_paths)
@@ -461,13 +555,12 @@ class PyEveSettingsGUI:
         self.available_servers = self.path_resolver.discover_servers()
         
         # Update server dropdown
-        server_names = sorted(self.available_servers.keys()) if self.available_servers else ['Tranquility']
-        self.server_combo['values'] = server_names
+        self._refresh_server_names()
         
         # Keep current server if still available, otherwise switch to first available
         if self.current_server not in self.available_servers:
             if self.available_servers:
-                self.current_server = server_names[0]
+                self.current_server = self._sorted_server_names[0]
                 self.server_var.set(self.current_server)
         
         # Reload data
@@ -477,13 +570,12 @@ class PyEveSettingsGUI:
         
         # Clear current data
         self.profiles_listbox.delete(0, tk.END)
-        self.chars_tree.delete(*self.chars_tree.get_children())
-        self.accounts_tree.delete(*self.accounts_tree.get_children())
+        clear_tree(self.chars_tree)
+        clear_tree(self.accounts_tree)
         self.path_var.set("")
         
         # Reload in background
-        self.loading = True
-        self.root.after(100, self.start_loading_data)
+        self.root.after_idle(self.start_loading_data)
     
     def _on_sort_changed(self, *args) -> None:
         """Handle default sorting preference change."""
@@ -497,8 +589,12 @@ class PyEveSettingsGUI:
         except ValidationError as e:
             messagebox.showerror("Invalid Sort Option", str(e))
     
-    def _apply_default_sorting(self) -> None:
-        """Apply default sorting to treeviews based on saved preference."""
+    def _get_default_sort(self) -> Tuple[str, bool]:
+        """Parse the saved sorting preference.
+        
+        Returns:
+            Tuple of (column, reverse) for the default sort.
+        """
         sort_pref = self.sort_var.get()
         
         # Parse the sorting preference
@@ -515,6 +611,12 @@ class PyEveSettingsGUI:
             column = 'name'
             reverse = False
         
+        return column, reverse
+    
+    def _apply_default_sorting(self) -> None:
+        """Apply default sorting to treeviews based on saved preference."""
+        column, reverse = self._get_default_sort()
+        
         # Apply to characters tree
         sort_tree(self.chars_tree, column, reverse)
         
@@ -526,58 +628,83 @@ class PyEveSettingsGUI:
         """Start loading data in a background thread."""
         thread = threading.Thread(target=self.load_data_thread, daemon=True)
         thread.start()
-        self.root.after(100, self.check_loading_status)
     
     def load_data_thread(self) -> None:
-        """Load data in background thread."""
+        """Load data in background thread.
+        
+        Results are put on the load queue rather than assigned to the GUI's
+        attributes, and a <<LoadingDone>> virtual event is generated so the
+        main thread can pick them up without polling.
+        """
+        server = self.current_server
         try:
             # Find settings directories
-            self.settings_folders = self.manager.discover_settings_folders()
+            settings_folders = self.manager.discover_settings_folders()
             
-            if not self.settings_folders:
-                self.loading = False
+            if not settings_folders:
+                self._load_queue.put(('done', server, settings_folders, [], []))
                 return
             
             # Load settings files and get character IDs that need fetching
-            character_ids = self.manager.load_files(self.settings_folders)
+            character_ids = self.manager.load_files(settings_folders)
             
             # Fetch character names in bulk if needed
             if character_ids:
                 self.api_cache.fetch_names_bulk(character_ids)
                 
-                # Save updated cache to disk
-                for char_id, name in self.api_cache.get_all_cached().items():
-                    self.data_file.save_character_name(str(char_id), name)
-                for invalid_id in self.api_cache.get_all_invalid():
-                    self.data_file.add_invalid_id(str(invalid_id))
-                self.data_file.save()
+                # Save only the newly resolved entries to disk
+                names, invalid = self.api_cache.pop_changes()
+                if names or invalid:
+                    self.data_file.set_character_names({str(k): v for k, v in names.items()})
+                    self.data_file.add_invalid_ids(str(i) for i in invalid)
+                    self.data_file.save()
             
-            # Store full lists for filtering
-            self.all_char_list = self.manager.char_list.copy()
-            self.all_user_list = self.manager.user_list.copy()
+            # Full lists for filtering (shared: load_files replaces rather than mutates them)
+            self._load_queue.put((
+                'done', server, settings_folders,
+                self.manager.char_list, self.manager.user_list,
+            ))
             
-            # Check if we have both types of files
-            if not self.manager.user_list or not self.manager.char_list:
-                self.loading = False
+        except Exception as e:
+            logger.exception("Error loading data")
+            self._load_queue.put(('error', server, e))
+        finally:
+            self.root.event_generate('<<LoadingDone>>', when='tail')
+    
+    def _on_loading_done(self, event: Optional[tk.Event] = None) -> None:
+        """Handle the <<LoadingDone>> event generated by the loader thread.
+        
+        Args:
+            event: The <<LoadingDone>> virtual event.
+        """
+        while True:
+            try:
+                result = self._load_queue.get_nowait()
+            except queue.Empty:
                 return
             
-            self.loading = False
+            kind, server = result[0], result[1]
+            if kind == 'done':
+                settings_folders, char_list, user_list = result[2:]
+                if settings_folders:
+                    self._server_cache[server] = (settings_folders, char_list, user_list)
             
-        except Exception as e:
-            print(f"Error loading data: {e}")
-            import traceback
-            traceback.print_exc()
-            self.loading = False
-    
-    def check_loading_status(self) -> None:
-        """Check if data loading is complete and update UI."""
-        if self.loading:
-            self.root.after(100, self.check_loading_status)
-        else:
+            # Results for a server the user has since switched away from stay cached only
+            if server != self.current_server:
+                continue
+            
+            # Restoring from the cache also points the manager back at this
+            # server's files in case a slower, stale load replaced them
+            if not self._restore_server_data(server):
+                self.settings_folders = []
+                self.all_char_list = []
+                self.all_user_list = []
             self.on_loading_complete()
     
     def on_loading_complete(self) -> None:
         """Called when data loading is complete."""
+        self._index_files_by_folder()
+        
         self.progress.stop()
         self.progress.grid_remove()
         
@@ -592,7 +719,7 @@ class PyEveSettingsGUI:
                                "Use Settings → Manage Paths to add custom EVE installation paths.")
             return
         
-        if not self.manager.user_list or not self.manager.char_list:
+        if not self.all_user_list or not self.all_char_list:
             self.status_label.config(
                 text="Warning: Missing user or char files in found directories.",
                 foreground="orange"
@@ -602,25 +729,21 @@ class PyEveSettingsGUI:
                                f"Searched in:\n" + "\n".join(str(f) for f in self.settings_folders) +
                                "\n\nUse Settings → Manage Paths to add different paths.")
             # Still show the profiles list
-            for folder in self.settings_folders:
-                self.profiles_listbox.insert(tk.END, folder.name)
+            self.profiles_listbox.insert(tk.END, *[f.name for f in self.settings_folders])
             return
         
         # Update status label
         folders_text = f"Found {len(self.settings_folders)} settings folder(s)"
         self.status_label.config(text=folders_text, foreground="gray")
         
-        # Populate profiles listbox
-        for folder in self.settings_folders:
-            self.profiles_listbox.insert(tk.END, folder.name)
+        # Populate profiles listbox in a single insert call
+        self.profiles_listbox.insert(tk.END, *[f.name for f in self.settings_folders])
         
         # Select first profile by default
         self.profiles_listbox.selection_set(0)
         self.selected_folder = self.settings_folders[0]
+        # Lists are populated already sorted by the default sorting preference
         self.handlers.update_character_lists()
-        
-        # Apply default sorting after data is loaded
-        self._apply_default_sorting()
     
     def run(self) -> None:
         """Start the GUI application."""
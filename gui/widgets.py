@@ -4,10 +4,44 @@ Widget creation and layout for py-eve-settings
 
 import tkinter as tk
 from tkinter import ttk
-from .helpers import sort_tree
+from typing import Dict, List, Optional, Sequence, Tuple
+from .helpers import request_sort, lazy_yscrollcommand
 import config
 
 
+class RowTreeview(ttk.Treeview):
+    """Treeview backed by a list of (iid, values) rows kept in Python
+    
+    Only the first `rendered` rows exist as Tk items; the helpers in
+    gui.helpers (set_tree_rows, render_rows, load_pending_rows, ...) insert
+    the rest on demand and keep this state in step with the widget.
+    """
+    
+    def __init__(self, master=None, **kw):
+        super().__init__(master, **kw)
+        # Every row shown by the tree, in display order
+        self.rows: List[Tuple[str, Sequence]] = []
+        # Number of leading rows inserted into Tk
+        self.rendered = 0
+        # (column, reverse) the rows are sorted by, or None if unsorted
+        self.sort_order: Optional[Tuple[str, bool]] = None
+        # Pending after() ids by key, for schedule_redraw
+        self.pending_redraws: Dict[str, str] = {}
+
+
+# Default Sorting menu entries as (label, value); (None, None) is a separator
+SORT_MENU_OPTIONS = (
+    ("Name (A-Z)", "name_asc"),
+    ("Name (Z-A)", "name_desc"),
+    (None, None),
+    ("ID (Ascending)", "id_asc"),
+    ("ID (Descending)", "id_desc"),
+    (None, None),
+    ("Date (Oldest First)", "date_asc"),
+    ("Date (Newest First)", "date_desc"),
+)
+
+
 def create_menu_bar(root: tk.Tk) -> dict:
     """Create menu bar and return references to important menu items"""
     menubar = tk.Menu(root)
@@ -32,14 +66,11 @@ def create_menu_bar(root: tk.Tk) -> dict:
     
     # Sorting options
     sort_var = tk.StringVar(value="name_asc")
-    sort_menu.add_radiobutton(label="Name (A-Z)", value="name_asc", variable=sort_var)
-    sort_menu.add_radiobutton(label="Name (Z-A)", value="name_desc", variable=sort_var)
-    sort_menu.add_separator()
-    sort_menu.add_radiobutton(label="ID (Ascending)", value="id_asc", variable=sort_var)
-    sort_menu.add_radiobutton(label="ID (Descending)", value="id_desc", variable=sort_var)
-    sort_menu.add_separator()
-    sort_menu.add_radiobutton(label="Date (Oldest First)", value="date_asc", variable=sort_var)
-    sort_menu.add_radiobutton(label="Date (Newest First)", value="date_desc", variable=sort_var)
+    for label, value in SORT_MENU_OPTIONS:
+        if label is None:
+            sort_menu.add_separator()
+        else:
+            sort_menu.add_radiobutton(label=label, value=value, variable=sort_var)
     
     return {
         'menubar': menubar,
@@ -168,8 +199,10 @@ def create_profiles_panel(parent: ttk.Frame) -> dict:
     profiles_frame.rowconfigure(0, weight=1)
     profiles_frame.columnconfigure(0, weight=1)
     
-    # Profiles listbox
-    profiles_listbox = tk.Listbox(profiles_frame, selectmode=tk.SINGLE)
+    # Profiles listbox (exportselection off so selecting text elsewhere doesn't
+    # clear the profile selection and fire <<ListboxSelect>>)
+    profiles_listbox = tk.Listbox(profiles_frame, selectmode=tk.SINGLE,
+                                  exportselection=False, activestyle='none')
     profiles_listbox.grid(row=0, column=0, sticky="nsew")
     
     profiles_scroll = ttk.Scrollbar(profiles_frame, orient=tk.VERTICAL, command=profiles_listbox.yview)
@@ -208,12 +241,12 @@ def create_characters_panel(parent: ttk.Frame) -> dict:
     chars_frame.columnconfigure(0, weight=1)
     
     # Characters treeview with sortable columns
-    chars_tree = ttk.Treeview(chars_frame, columns=('id', 'name', 'date', 'note'), 
-                              show='headings', selectmode='browse')
-    chars_tree.heading('id', text='ID', command=lambda: sort_tree(chars_tree, 'id', False))
-    chars_tree.heading('name', text='Name', command=lambda: sort_tree(chars_tree, 'name', False))
-    chars_tree.heading('date', text='Last Modified', command=lambda: sort_tree(chars_tree, 'date', False))
-    chars_tree.heading('note', text='Note', command=lambda: sort_tree(chars_tree, 'note', False))
+    chars_tree = RowTreeview(chars_frame, columns=('id', 'name', 'date', 'note'), 
+                             show='headings', selectmode='browse')
+    chars_tree.heading('id', text='ID', command=lambda: request_sort(chars_tree, 'id', False))
+    chars_tree.heading('name', text='Name', command=lambda: request_sort(chars_tree, 'name', False))
+    chars_tree.heading('date', text='Last Modified', command=lambda: request_sort(chars_tree, 'date', False))
+    chars_tree.heading('note', text='Note', command=lambda: request_sort(chars_tree, 'note', False))
     
     chars_tree.column('id', width=100, anchor='center')
     chars_tree.column('name', width=150, anchor='w')
@@ -224,7 +257,7 @@ def create_characters_panel(parent: ttk.Frame) -> dict:
     
     chars_scroll = ttk.Scrollbar(chars_frame, orient=tk.VERTICAL, command=chars_tree.yview)
     chars_scroll.grid(row=0, column=1, sticky="ns")
-    chars_tree.configure(yscrollcommand=chars_scroll.set)
+    chars_tree.configure(yscrollcommand=lazy_yscrollcommand(chars_tree, chars_scroll))
     
     # Character buttons - will be connected to handlers later
     char_btn_frame = ttk.Frame(chars_frame)
@@ -260,11 +293,11 @@ def create_accounts_panel(parent: ttk.Frame) -> dict:
     accounts_frame.columnconfigure(0, weight=1)
     
     # Accounts treeview with sortable columns
-    accounts_tree = ttk.Treeview(accounts_frame, columns=('id', 'date', 'note'), 
-                                 show='headings', selectmode='browse')
-    accounts_tree.heading('id', text='ID', command=lambda: sort_tree(accounts_tree, 'id', False))
-    accounts_tree.heading('date', text='Last Modified', command=lambda: sort_tree(accounts_tree, 'date', False))
-    accounts_tree.heading('note', text='Note', command=lambda: sort_tree(accounts_tree, 'note', False))
+    accounts_tree = RowTreeview(accounts_frame, columns=('id', 'date', 'note'), 
+                                show='headings', selectmode='browse')
+    accounts_tree.heading('id', text='ID', command=lambda: request_sort(accounts_tree, 'id', False))
+    accounts_tree.heading('date', text='Last Modified', command=lambda: request_sort(accounts_tree, 'date', False))
+    accounts_tree.heading('note', text='Note', command=lambda: request_sort(accounts_tree, 'note', False))
     
     accounts_tree.column('id', width=100, anchor='center')
     accounts_tree.column('date', width=140, anchor='center')
@@ -274,7 +307,7 @@ def create_accounts_panel(parent: ttk.Frame) -> dict:
     
     accounts_scroll = ttk.Scrollbar(accounts_frame, orient=tk.VERTICAL, command=accounts_tree.yview)
     accounts_scroll.grid(row=0, column=1, sticky="ns")
-    accounts_tree.configure(yscrollcommand=accounts_scroll.set)
+    accounts_tree.configure(yscrollcommand=lazy_yscrollcommand(accounts_tree, accounts_scroll))
     
     # Account buttons - will be connected to handlers later
     account_btn_frame = ttk.Frame(accounts_frame)
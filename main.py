@@ -2,11 +2,26 @@
 Main entry point for py-eve-settings application
 """
 
+import logging
+import os
+
+import config
 from gui import PyEveSettingsGUI
 
 
+def configure_logging():
+    """Configure application logging.
+    
+    Uses config.LOG_LEVEL unless overridden by the PYEVESETTINGS_LOG_LEVEL
+    environment variable (e.g. PYEVESETTINGS_LOG_LEVEL=DEBUG).
+    """
+    level = os.environ.get('PYEVESETTINGS_LOG_LEVEL', config.LOG_LEVEL).upper()
+    logging.basicConfig(level=getattr(logging, level, logging.INFO), format=config.LOG_FORMAT)
+
+
 def main():
     """Main entry point"""
+    configure_logging()
     try:
         app = PyEveSettingsGUI()
         app.run()
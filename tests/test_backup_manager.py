@@ -1,8 +1,11 @@
+import os
 import zipfile
 import unittest
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import cast
+from unittest import mock
 
 from utils.backup_manager import BackupManager
 
@@ -45,6 +48,153 @@ class BackupManagerTests(unittest.TestCase):
             "Profile root was not preserved in archive",
         )
 
+    def test_create_backup_includes_nested_files(self):
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+
+        self.assertTrue(success, message)
+        with zipfile.ZipFile(cast(Path, backup_path), "r") as zipf:
+            self.assertEqual(
+                [f"{self.profile_name}/core_user_123.dat", f"{self.profile_name}/subdir/core_char_456.dat"],
+                zipf.namelist(),
+            )
+
+    def test_create_backup_skips_unreadable_folders(self):
+        real_scandir = os.scandir
+        unreadable = os.fspath(self.profile_dir / "subdir")
+
+        def scandir(path):
+            if os.fspath(path) == unreadable:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        with mock.patch("utils.backup_manager.os.scandir", side_effect=scandir), \
+                self.assertLogs("utils.backup_manager", "WARNING"):
+            success, message, backup_path = self.manager.create_backup(self.profile_dir)
+
+        self.assertTrue(success, message)
+        with zipfile.ZipFile(cast(Path, backup_path), "r") as zipf:
+            self.assertEqual([f"{self.profile_name}/core_user_123.dat"], zipf.namelist())
+
+    def test_create_backup_removes_partial_archive_on_error(self):
+        with mock.patch.object(BackupManager, "_choose_compression", side_effect=OSError("disk full")):
+            success, message, backup_path = self.manager.create_backup(self.profile_dir)
+
+        self.assertFalse(success)
+        self.assertIsNone(backup_path)
+        self.assertEqual([], list(self.manager.get_backup_directory().glob("*.zip")))
+
+    def test_create_backup_stores_incompressible_files(self):
+        (self.profile_dir / "random.bin").write_bytes(os.urandom(8192))
+        (self.profile_dir / "repetitive.dat").write_bytes(b"settings" * 1024)
+
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+
+        self.assertTrue(success, message)
+        with zipfile.ZipFile(cast(Path, backup_path), "r") as zipf:
+            self.assertEqual(zipfile.ZIP_STORED, zipf.getinfo(f"{self.profile_name}/random.bin").compress_type)
+            self.assertEqual(
+                zipfile.ZIP_DEFLATED,
+                zipf.getinfo(f"{self.profile_name}/repetitive.dat").compress_type,
+            )
+            self.assertIsNone(zipf.testzip())
+
+    def test_create_backup_accepts_pre_1980_timestamps(self):
+        old_file = self.profile_dir / "core_user_123.dat"
+        os.utime(old_file, (0, 0))
+
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+
+        self.assertTrue(success, message)
+        with zipfile.ZipFile(cast(Path, backup_path), "r") as zipf:
+            info = zipf.getinfo(f"{self.profile_name}/core_user_123.dat")
+        self.assertEqual((1980, 1, 1, 0, 0, 0), info.date_time)
+
+    def test_list_backups_returns_zip_files_newest_first(self):
+        backup_dir = self.manager.get_backup_directory()
+        old = backup_dir / "settings_Default_20230101_000000.zip"
+        new = backup_dir / "settings_Default_20240101_000000.zip"
+        for path, mtime in ((old, 1_000_000_000), (new, 2_000_000_000)):
+            path.write_bytes(b"zip")
+            os.utime(path, (mtime, mtime))
+        (backup_dir / "notes.txt").write_text("not a backup", encoding="utf-8")
+
+        backups = self.manager.list_backups()
+
+        self.assertEqual([new, old], [path for path, _, _ in backups])
+        self.assertEqual(3, backups[0][2])
+
+        stats = self.manager.get_backup_stats()
+        self.assertEqual(2, stats['count'])
+        self.assertEqual(backups[-1][1], stats['oldest'])
+        self.assertEqual(backups[0][1], stats['newest'])
+
+    def test_discover_backup_directories_across_installations(self):
+        backup_dir = self.manager.get_backup_directory()
+        (backup_dir / "backups").mkdir()  # Nested folders inside a backup directory are not searched
+
+        other_root = tempfile.TemporaryDirectory()
+        self.addCleanup(other_root.cleanup)
+        other_install = Path(other_root.name) / "c_ccp_eve_sisi_singularity"
+        (other_install / "backups").mkdir(parents=True)
+
+        found = BackupManager.discover_all_backup_directories([Path(other_root.name), self.base_path])
+
+        self.assertEqual(
+            [(other_install / "backups", "Singularity"), (backup_dir, "Unknown")],
+            [(info['backup_dir'], info['server_name']) for info in found],
+        )
+
+    def test_backup_metadata_counts_entries(self):
+        success, _, backup_path = self.manager.create_backup(self.profile_dir)
+        self.assertTrue(success)
+
+        metadata = self.manager.get_backup_metadata(cast(Path, backup_path))
+
+        self.assertTrue(metadata['is_valid'])
+        self.assertEqual(2, metadata['file_count'])
+        self.assertEqual(self.profile_name, metadata['profile_name'])
+
+    def test_zip_summary_cache_keeps_one_entry_per_archive(self):
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+        self.assertTrue(success, message)
+        backup_path = cast(Path, backup_path)
+        key = os.fspath(backup_path)
+
+        self.manager.get_backup_metadata(backup_path)
+        with zipfile.ZipFile(backup_path, "a") as zipf:
+            zipf.writestr("extra.txt", "more")
+        self.assertEqual(3, self.manager.get_backup_metadata(backup_path)["file_count"])
+        stat = backup_path.stat()
+        self.assertEqual((stat.st_mtime_ns, stat.st_size), BackupManager._zip_summary_cache[key][0])
+
+        self.manager.delete_backup(backup_path)
+        self.assertNotIn(key, BackupManager._zip_summary_cache)
+
+    def test_zip_summary_cache_is_bounded(self):
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+        self.assertTrue(success, message)
+        backup_path = cast(Path, backup_path)
+        copies = [backup_path.with_name(f"copy_{i}.zip") for i in range(3)]
+        for copy in copies:
+            copy.write_bytes(backup_path.read_bytes())
+
+        with mock.patch.object(BackupManager, "ZIP_SUMMARY_CACHE_SIZE", 2), \
+                mock.patch.object(BackupManager, "_zip_summary_cache", OrderedDict()):
+            for copy in copies:
+                self.assertEqual(2, self.manager.get_backup_metadata(copy)["file_count"])
+
+            self.assertEqual([os.fspath(c) for c in copies[1:]], list(BackupManager._zip_summary_cache))
+
+    def test_filter_backups_by_profile_and_server(self):
+        tq = Path("c_ccp_eve_tq_tranquility") / "backups"
+        default = tq / "settings_Default_20240101_000000.zip"
+        alt = tq / "settings_Alt_20240101_000000.zip"
+        sisi = Path("c_ccp_eve_sisi_singularity") / "backups" / "settings_Default_20240101_000000.zip"
+        backups = [default, alt, sisi]
+
+        self.assertEqual([default, sisi], self.manager.filter_backups(backups, profile="settings_Default"))
+        self.assertEqual([default], self.manager.filter_backups(backups, profile="settings_Default", server="Tranquility"))
+
     def test_restore_overwrite_removes_nested_folder(self):
         success, _, backup_path = self.manager.create_backup(self.profile_dir)
         self.assertTrue(success, "Failed to create backup for restore test")
@@ -77,6 +227,30 @@ class BackupManagerTests(unittest.TestCase):
             "Nested profile folder detected after restore",
         )
 
+    def test_restore_extracts_every_member_intact(self):
+        contents = {}
+        for i in range(200):
+            folder = self.profile_dir / f"cache{i % 7}"
+            folder.mkdir(exist_ok=True)
+            data = os.urandom(64 + i * 37) if i % 2 else (f"settings {i}\n" * (i + 1)).encode()
+            (folder / f"core_char_{i:08d}.dat").write_bytes(data)
+            contents[f"cache{i % 7}/core_char_{i:08d}.dat"] = data
+        contents["core_user_123.dat"] = b"user-data"
+        contents["subdir/core_char_456.dat"] = b"char-data"
+
+        success, message, backup_path = self.manager.create_backup(self.profile_dir)
+        self.assertTrue(success, message)
+
+        restore_to = self.base_path / "settings_Restored"
+        restore_success, restore_message = self.manager.restore_backup(cast(Path, backup_path), restore_to)
+        self.assertTrue(restore_success, restore_message)
+
+        restored = {
+            path.relative_to(restore_to).as_posix(): path.read_bytes()
+            for path in restore_to.rglob("*") if path.is_file()
+        }
+        self.assertEqual(contents, restored)
+
 
 if __name__ == "__main__":
     unittest.main()
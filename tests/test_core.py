@@ -0,0 +1,78 @@
+import os
+import unittest
+import tempfile
+from pathlib import Path
+
+from utils.core import SettingsManager
+
+
+class SettingsManagerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmpdir.name)
+        self.source = self.folder / "core_char_90000001.dat"
+        self.target = self.folder / "core_char_90000002.dat"
+        self.source.write_text("source")
+        self.target.write_text("target")
+        os.utime(self.source, (2_000_000_000, 2_000_000_000))
+        os.utime(self.target, (1_000_000_000, 1_000_000_000))
+
+        self.manager = SettingsManager()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_load_files_caches_modification_time(self):
+        self.manager.load_files([self.folder])
+
+        self.assertEqual([90000001, 90000002], [sf.id for sf in self.manager.char_list])
+        self.assertEqual(2_000_000_000, self.manager.char_list[0].mtime)
+        self.assertEqual(self.folder.name, self.manager.char_list[0].folder_name)
+
+    def test_load_files_skips_templates_and_other_files(self):
+        (self.folder / "core_char__.dat").write_text("template")
+        (self.folder / "core_user__.dat").write_text("template")
+        (self.folder / "core_user_123456.dat").write_text("user")
+        (self.folder / "prefs.ini").write_text("prefs")
+
+        self.manager.load_files([self.folder])
+
+        self.assertEqual(["core_user_123456.dat"], [sf.name for sf in self.manager.user_list])
+        self.assertEqual(2, len(self.manager.char_list))
+
+    def test_load_files_merges_multiple_folders(self):
+        other_folder = self.folder / "settings_Mining"
+        other_folder.mkdir()
+        other = other_folder / "core_char_90000003.dat"
+        other.write_text("other")
+        os.utime(other, (1_500_000_000, 1_500_000_000))
+
+        character_ids = self.manager.load_files([self.folder, other_folder])
+
+        self.assertEqual([90000001, 90000003, 90000002], [sf.id for sf in self.manager.char_list])
+        self.assertEqual([90000001, 90000002, 90000003], sorted(character_ids))
+        self.assertEqual(other_folder, self.manager.char_list[1].folder)
+        self.assertEqual("settings_Mining", self.manager.char_list[1].folder_name)
+
+    def test_copy_refreshes_target_modification_time(self):
+        self.manager.load_files([self.folder])
+        source, target = self.manager.char_list
+        old_date = target.date_str
+
+        self.manager.copy_settings_to_targets(source)
+
+        self.assertEqual(source.mtime, target.mtime)
+        self.assertNotEqual(old_date, target.date_str)
+
+    def test_copy_only_touches_given_targets(self):
+        other = self.folder / "core_char_90000003.dat"
+        other.write_text("other")
+        self.manager.load_files([self.folder])
+        by_id = {sf.id: sf for sf in self.manager.char_list}
+
+        copied = self.manager.copy_settings_to_targets(by_id[90000001], targets=[by_id[90000002]])
+
+        self.assertEqual(1, copied)
+        self.assertEqual("source", self.target.read_text())
+        self.assertEqual("other", other.read_text())
+        self.assertEqual(3, len(self.manager.char_list))
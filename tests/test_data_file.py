@@ -0,0 +1,111 @@
+import json
+import os
+import stat
+import threading
+import unittest
+import tempfile
+from pathlib import Path
+
+from data.data_file import DataFile
+
+
+class DataFileTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = Path(self._tmpdir.name) / "data.json"
+        self.data_file = DataFile(self.file_path)
+        self.data_file.load()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_bulk_name_and_invalid_updates_preserve_notes(self):
+        self.data_file.set_character_note("1000001", "main")
+        self.data_file.set_character_note("1000003", "gone")
+
+        self.data_file.set_character_names({"1000001": "Alpha", "1000002": "Beta"})
+        self.data_file.add_invalid_ids(["1000003"])
+
+        self.assertEqual(
+            {"1000001": "Alpha", "1000002": "Beta"},
+            self.data_file.get_character_names(),
+        )
+        self.assertEqual({"1000003"}, self.data_file.get_invalid_ids())
+        self.assertEqual(
+            {"1000001": "main", "1000003": "gone"},
+            self.data_file.get_character_notes(),
+        )
+
+    def test_int_keyed_accessors_match_string_accessors(self):
+        self.data_file.set_character_names({"1000001": "Alpha"})
+        self.data_file.add_invalid_ids(["1000002"])
+        self.data_file.set_character_note("1000003", "no name yet")
+
+        self.assertEqual({1000001: "Alpha"}, self.data_file.get_character_names_int())
+        self.assertEqual({1000002}, self.data_file.get_invalid_ids_int())
+        self.assertEqual(
+            (
+                self.data_file.get_character_names_int(),
+                self.data_file.get_invalid_ids_int(),
+                self.data_file.get_character_notes(),
+            ),
+            self.data_file.get_character_data(),
+        )
+
+    def test_save_round_trip(self):
+        self.data_file.set_character_names({"1000001": "Alpha"})
+        self.data_file.set_account_note("42", "alt account")
+        self.data_file.save()
+
+        with self.file_path.open("r", encoding="utf-8") as f:
+            raw = json.load(f)
+        self.assertEqual("Alpha", raw["character_ids"]["1000001"]["name"])
+
+        reloaded = DataFile(self.file_path)
+        reloaded.load()
+        self.assertEqual({"1000001": "Alpha"}, reloaded.get_character_names())
+        self.assertEqual({"42": "alt account"}, reloaded.get_account_notes())
+
+    def test_set_note_reports_whether_anything_changed(self):
+        self.assertTrue(self.data_file.set_character_note("1000001", "main"))
+        self.assertFalse(self.data_file.set_character_note("1000001", "main"))
+        self.assertFalse(self.data_file.set_account_note("43", ""))
+        self.assertTrue(self.data_file.set_account_note("42", "alt"))
+        self.assertFalse(self.data_file.set_account_note("42", "alt"))
+
+        self.assertEqual({"1000001": "main"}, self.data_file.get_character_notes())
+        self.assertNotIn("43", self.data_file._data["account_ids"])
+
+    def test_concurrent_saves_do_not_collide(self):
+        self.data_file.set_character_names({"1000001": "Alpha"})
+        errors = []
+
+        def save_repeatedly():
+            try:
+                for _ in range(50):
+                    self.data_file.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save_repeatedly) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual([self.file_path], list(self.file_path.parent.iterdir()))
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_save_keeps_file_permissions(self):
+        self.data_file.save()
+        os.chmod(self.file_path, 0o640)
+
+        self.data_file.set_account_note("42", "alt")
+        self.data_file.save()
+
+        self.assertEqual(0o640, stat.S_IMODE(os.stat(self.file_path).st_mode))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from esi import ESICache, ESIClient
+from utils import InvalidCharacterError
+
+
+class FakeESIClient(ESIClient):
+    """ESI client answering from a fixed name table instead of the network."""
+
+    NAMES_BATCH_SIZE = 2
+
+    def __init__(self, names):
+        super().__init__()
+        self.names = names
+        self.batches = []
+        self.singles = []
+
+    def fetch_names(self, char_ids):
+        self.batches.append(sorted(char_ids))
+        if any(cid not in self.names for cid in char_ids):
+            raise InvalidCharacterError("Character ID not found (HTTP 404)")
+        return {cid: self.names[cid] for cid in char_ids}
+
+    def fetch_character_name(self, char_id):
+        self.singles.append(char_id)
+        return self.names.get(char_id)
+
+
+class ESICacheTests(unittest.TestCase):
+    def test_fetch_names_bulk_resolves_in_batches(self):
+        client = FakeESIClient({1: "Alpha", 2: "Beta", 3: "Gamma"})
+        cache = ESICache(client)
+
+        names = cache.fetch_names_bulk([3, 1, 2, 1])
+
+        self.assertEqual({1: "Alpha", 2: "Beta", 3: "Gamma"}, names)
+        self.assertEqual(2, len(client.batches))
+        self.assertEqual([], client.singles)
+
+    def test_fetch_names_bulk_splits_rejected_batch(self):
+        client = FakeESIClient({1: "Alpha", 2: "Beta", 3: "Gamma"})
+        cache = ESICache(client)
+
+        names = cache.fetch_names_bulk([1, 2, 3, 4])
+
+        self.assertEqual({1: "Alpha", 2: "Beta", 3: "Gamma"}, names)
+        self.assertIn([3], client.batches)
+        self.assertIn([4], client.batches)
+        self.assertEqual([], client.singles)
+        self.assertTrue(cache.is_invalid(4))
+        self.assertFalse(cache.is_invalid(3))
+
+    def test_pop_changes_returns_only_new_entries(self):
+        client = FakeESIClient({1: "Alpha", 2: "Beta"})
+        cache = ESICache(client)
+        cache.load_cache({1: "Alpha"}, set())
+
+        cache.fetch_names_bulk([1, 2, 3])
+
+        self.assertEqual(({2: "Beta"}, {3}), cache.pop_changes())
+        self.assertEqual(({}, set()), cache.pop_changes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from gui.helpers import build_file_rows
+from utils.core import SettingsManager
+
+
+class BuildFileRowsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmpdir.name)
+        for name in (
+            "core_char_90000001.dat",
+            "core_char_90000001 - Copy.dat",
+            "core_user_12345678.dat",
+            "core_user_12345678.dat.bak",
+        ):
+            (self.folder / name).write_text(name)
+
+        self.manager = SettingsManager()
+        self.manager.load_files([self.folder])
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_files_sharing_an_id_get_distinct_rows(self):
+        for files, with_name in ((self.manager.char_list, True), (self.manager.user_list, False)):
+            rows = build_file_rows(files, {}, with_name)
+
+            self.assertEqual(2, len(rows))
+            self.assertEqual(2, len({iid for iid, _ in rows}))
+            self.assertEqual({str(sf.path) for sf in files}, {iid for iid, _ in rows})
+            # The ID is still shown in the first column
+            self.assertEqual({files[0].id_str}, {values[0] for _, values in rows})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import unittest
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from utils.paths import EVEPathResolver
+from utils.platform_detector import Platform
+
+
+class EVEPathResolverTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.install_path = Path(self._tmpdir.name)
+        (self.install_path / "c_ccp_eve_tq_tranquility").mkdir()
+        (self.install_path / "unrelated_folder").mkdir()
+
+        self.resolver = EVEPathResolver(custom_paths=[str(self.install_path)])
+        # Keep the test independent of any real EVE installation on this machine
+        self.resolver._get_eve_base_directory = lambda: None
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_discover_servers_finds_custom_path_servers(self):
+        servers = self.resolver.discover_servers()
+
+        self.assertEqual(
+            {"Tranquility": str(self.install_path / "c_ccp_eve_tq_tranquility")},
+            servers,
+        )
+
+    def test_discover_servers_rescans_when_directory_changes(self):
+        self.resolver.discover_servers()
+
+        (self.install_path / "c_ccp_eve_sisi_singularity").mkdir()
+        # Make sure the directory mtime moves even on coarse-grained filesystems
+        self._bump_mtime(self.install_path)
+
+        servers = self.resolver.discover_servers()
+        self.assertIn("Singularity", servers)
+
+    def test_discover_servers_orders_by_display_name(self):
+        (self.install_path / "c_ccp_eve_sisi_singularity").mkdir()
+        (self.install_path / "c_ccp_eve_dual_duality").mkdir()
+        self.resolver._servers_cache = None
+
+        self.assertEqual(
+            ["Duality", "Singularity", "Tranquility"],
+            list(self.resolver.discover_servers()),
+        )
+
+    def test_get_server_folder_name_prefers_discovered_folder(self):
+        self.assertEqual(
+            str(self.install_path / "c_ccp_eve_tq_tranquility"),
+            self.resolver.get_server_folder_name("TRANQUILITY"),
+        )
+        self.assertEqual("c_ccp_eve_sisi_singularity", self.resolver.get_server_folder_name("singularity"))
+
+    def test_discover_servers_result_is_not_shared_with_cache(self):
+        servers = self.resolver.discover_servers()
+        servers.clear()
+
+        self.assertIn("Tranquility", self.resolver.discover_servers())
+
+    def _bump_mtime(self, path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_find_settings_folders_rescans_when_directory_changes(self):
+        server_dir = self.install_path / "c_ccp_eve_tq_tranquility"
+        (server_dir / "settings_Default").mkdir()
+        self.assertEqual([server_dir / "settings_Default"], self.resolver.find_settings_folders(server_dir))
+
+        (server_dir / "settings_Mining").mkdir()
+        self._bump_mtime(server_dir)
+
+        self.assertEqual(
+            [server_dir / "settings_Default", server_dir / "settings_Mining"],
+            self.resolver.find_settings_folders(server_dir),
+        )
+
+    def test_validate_settings_folder_rescans_when_files_change(self):
+        folder = self.install_path / "settings_Default"
+        folder.mkdir()
+        (folder / "core_char_90000001.dat").write_text("")
+        self.assertFalse(self.resolver.validate_settings_folder(folder))
+
+        (folder / "core_user_123456.dat").write_text("")
+        self._bump_mtime(folder)
+
+        self.assertTrue(self.resolver.validate_settings_folder(folder))
+
+    def test_validate_settings_folder_ignores_default_templates(self):
+        folder = self.install_path / "settings_Default"
+        folder.mkdir()
+        (folder / "core_char__.dat").write_text("")
+        (folder / "core_user__.dat").write_text("")
+        self.assertFalse(self.resolver.validate_settings_folder(folder))
+
+    def test_cached_exists_reuses_result_until_refresh(self):
+        candidate = self.install_path / "c_ccp_eve_sisi_singularity"
+        self.assertFalse(self.resolver._cached_exists(candidate))
+
+        candidate.mkdir()
+        self.assertFalse(self.resolver._cached_exists(candidate))
+
+        self.resolver.refresh()
+        self.assertTrue(self.resolver._cached_exists(candidate))
+
+    def test_windows_eve_directory_uses_localappdata(self):
+        resolver = EVEPathResolver()
+        resolver.platform = Platform.WINDOWS
+
+        with mock.patch.dict(os.environ, {"LOCALAPPDATA": "D:/Profiles/pilot/AppData/Local"}):
+            self.assertEqual(
+                Path("D:/Profiles/pilot/AppData/Local") / "CCP" / "EVE",
+                resolver._get_eve_base_directory(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,54 @@
 """Backup manager for EVE settings profiles."""
 
+import logging
+import os
+import re
 import shutil
 import zipfile
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from stat import S_ISDIR
+from typing import Iterable, Iterator, Optional
 from datetime import datetime
 from .exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
+# {profile_name}_{YYYYMMDD}_{HHMMSS}, e.g. settings_Default_20231019_141036
+_BACKUP_NAME_RE = re.compile(r'(.*)_(\d{8})_(\d{6})$')
+
+# Server names as they appear in installation folder names, in one pattern
+_SERVER_RE = re.compile(r'tranquility|singularity|sisi|thunderdome', re.IGNORECASE)
+_SERVER_NAMES = {
+    'tranquility': 'Tranquility',
+    'singularity': 'Singularity',
+    'sisi': 'Singularity',
+    'thunderdome': 'Thunderdome',
+}
+
 
 class BackupManager:
     """Manages backups of EVE settings profiles."""
     
     BACKUP_DIR_NAME = "backups"
+    # Settings files are small; fast deflate keeps backups I/O-bound at a
+    # negligible size cost compared to the default level 6
+    COMPRESS_LEVEL = 1
+    # Bytes of each file deflated to judge whether compressing it is worthwhile
+    COMPRESSION_SAMPLE_SIZE = 4096
+    # path -> ((mtime_ns, size), (file_count, is_valid)), shared by all
+    # instances; one entry per archive, replaced when the archive changes,
+    # least recently used entries dropped beyond ZIP_SUMMARY_CACHE_SIZE
+    _zip_summary_cache: 'OrderedDict[str, tuple[tuple[int, int], tuple[int, bool]]]' = OrderedDict()
+    ZIP_SUMMARY_CACHE_SIZE = 4096
+    # Worker threads reading files ahead of the (single-threaded) zip writer
+    READ_WORKERS = 4
+    # Files above this size are streamed into the zip rather than read ahead
+    LARGE_FILE_SIZE = 16 * 1024 * 1024
+    # Worker threads extracting members during a restore
+    RESTORE_WORKERS = 4
     
     def __init__(self, base_path: Optional[Path] = None):
         """Initialize the backup manager.
@@ -20,6 +57,8 @@ class BackupManager:
             base_path: Base EVE directory containing settings folders.
         """
         self.base_path = base_path
+        # Backup directory already created for base path: (base_path, backup_dir)
+        self._backup_dir_cache: Optional[tuple[Path, Path]] = None
     
     def set_base_path(self, base_path: Path) -> None:
         """Set or update the base path.
@@ -38,8 +77,15 @@ class BackupManager:
         if not self.base_path:
             return None
         
+        # Only create the directory once per base path; it is re-created if
+        # it has been removed since
+        cached = self._backup_dir_cache
+        if cached is not None and cached[0] == self.base_path and cached[1].is_dir():
+            return cached[1]
+        
         backup_dir = self.base_path / self.BACKUP_DIR_NAME
         backup_dir.mkdir(parents=True, exist_ok=True)
+        self._backup_dir_cache = (self.base_path, backup_dir)
         return backup_dir
     
     def create_backup(self, profile_folder: Path) -> tuple[bool, str, Optional[Path]]:
@@ -54,115 +100,190 @@ class BackupManager:
                 - message: Status message describing the result
                 - backup_path: Path to the created backup file, or None if failed
         """
-        print(f"[DEBUG] create_backup called with profile_folder: {profile_folder}")
-        
         # Validate inputs
         if not self.base_path:
-            print("[DEBUG] Base path not set")
             return False, "Base path not set", None
         
-        print(f"[DEBUG] Base path: {self.base_path}")
-        
-        if not profile_folder.exists():
-            print(f"[DEBUG] Profile folder does not exist: {profile_folder}")
+        # One stat() answers both "exists" and "is a directory"
+        try:
+            folder_mode = profile_folder.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             return False, f"Profile folder does not exist: {profile_folder.name}", None
         
-        if not profile_folder.is_dir():
-            print(f"[DEBUG] Not a directory: {profile_folder}")
+        if not S_ISDIR(folder_mode):
             return False, f"Not a directory: {profile_folder.name}", None
         
-        print("[DEBUG] Profile folder validation passed")
-        
         # Get backup directory
-        print("[DEBUG] Getting backup directory...")
         backup_dir = self.get_backup_directory()
         if not backup_dir:
-            print("[DEBUG] Could not create backup directory")
             return False, "Could not create backup directory", None
         
-        print(f"[DEBUG] Backup directory: {backup_dir}")
-        
         # Generate backup filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         profile_name = profile_folder.name
         backup_filename = f"{profile_name}_{timestamp}.zip"
         backup_path = backup_dir / backup_filename
         
-        print(f"[DEBUG] Backup will be created at: {backup_path}")
+        logger.debug("Backing up %s to %s", profile_folder, backup_path)
         
         # Create the backup
         try:
-            print("[DEBUG] Starting file collection...", flush=True)
             files_backed_up = 0
             
-            print(f"[DEBUG] Opening zip file: {backup_path}", flush=True)
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Backup all files in the profile folder, including the folder itself
-                print(f"[DEBUG] Searching for files in: {profile_folder}", flush=True)
-                
-                # Collect all files first (to avoid issues during iteration)
-                files_to_backup = []
-                for file_path in profile_folder.rglob('*'):
-                    if file_path.is_file():
-                        files_to_backup.append(file_path)
-                
-                print(f"[DEBUG] Found {len(files_to_backup)} files to backup", flush=True)
-                
-                # Now add them to the zip
-                for file_path in files_to_backup:
-                    # Store with profile folder name included in the path
-                    arcname = Path(profile_name) / file_path.relative_to(profile_folder)
-                    if files_backed_up < 5 or files_backed_up % 20 == 0:
-                        print(f"[DEBUG] Adding file {files_backed_up + 1}: {arcname}", flush=True)
-                    zipf.write(file_path, arcname)
-                    files_backed_up += 1
-            
-            print(f"[DEBUG] Zip file closed. Total files backed up: {files_backed_up}", flush=True)
+            try:
+                with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED,
+                                     compresslevel=self.COMPRESS_LEVEL,
+                                     strict_timestamps=False) as zipf:
+                    # Stream files straight into the zip, including the profile folder
+                    # itself; the backup directory is outside the profile folder, so
+                    # the walk never sees the archive
+                    files = self._iter_files(profile_folder, profile_name)
+                    for file_path, zinfo, data in self._read_ahead(files):
+                        if data is None:
+                            # Too large to hold in memory; zipfile streams it in chunks
+                            zipf.write(file_path, zinfo.filename)
+                        else:
+                            zipf.writestr(zinfo, data, compress_type=self._choose_compression(data),
+                                          compresslevel=self.COMPRESS_LEVEL)
+                        files_backed_up += 1
+            except BaseException:
+                # Don't leave a partial archive behind in the backups folder
+                backup_path.unlink(missing_ok=True)
+                raise
             
             if files_backed_up == 0:
-                print("[DEBUG] No files found to backup, removing empty zip")
                 backup_path.unlink()  # Remove empty backup
                 return False, "No files found to backup", None
             
             # Get backup size for status message
             size_mb = backup_path.stat().st_size / (1024 * 1024)
-            print(f"[DEBUG] Backup complete. Size: {size_mb:.1f} MB")
+            logger.debug("Backup complete: %d files, %.1f MB", files_backed_up, size_mb)
             
             return True, f"{files_backed_up} files ({size_mb:.1f} MB)", backup_path
             
         except PermissionError as e:
-            print(f"[DEBUG] PermissionError: {e}")
             return False, f"Permission denied: {e}", None
         except OSError as e:
-            print(f"[DEBUG] OSError: {e}")
             return False, f"Error creating backup: {e}", None
         except Exception as e:
-            print(f"[DEBUG] Unexpected exception: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Unexpected error creating backup")
             return False, f"Unexpected error: {e}", None
     
-    def list_backups(self) -> list[tuple[Path, datetime, int]]:
-        """List all available backups.
+    @classmethod
+    def _choose_compression(cls, data: bytes) -> int:
+        """Pick the zip compression method for a file's contents.
+        
+        Deflates a small sample first; data that doesn't shrink (already
+        compressed) is stored as-is rather than deflated for nothing.
         
+        Args:
+            data: File contents.
+            
         Returns:
-            List of tuples (backup_path, creation_time, size_bytes) sorted by creation time (newest first).
+            zipfile.ZIP_DEFLATED or zipfile.ZIP_STORED.
+        """
+        sample = data[:cls.COMPRESSION_SAMPLE_SIZE]
+        if sample and len(zlib.compress(sample, 1)) > len(sample) * 0.95:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+    
+    @staticmethod
+    def _iter_files(root: Path, arc_root: str) -> Iterator[tuple[str, str]]:
+        """Walk a folder tree, yielding every regular file.
+        
+        Uses os.scandir so file types come from the directory listing rather
+        than a stat() per entry. Like rglob, symlinked directories are not
+        descended into and folders that can't be read are skipped. Entries
+        are yielded in name order (each folder's files, then its subfolders),
+        so an unchanged profile always produces the same archive layout.
+        
+        Args:
+            root: Folder to walk.
+            arc_root: Archive path the root folder maps to.
+            
+        Yields:
+            Tuples of (file_path, arcname) with arcname relative to arc_root.
+        """
+        stack = [(os.fspath(root), arc_root)]
+        while stack:
+            folder, arc_folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except PermissionError:
+                logger.warning("Permission denied accessing %s", folder)
+                continue
+            
+            subfolders = []
+            for entry in entries:
+                arcname = f"{arc_folder}/{entry.name}"
+                if entry.is_file():
+                    yield entry.path, arcname
+                elif entry.is_dir(follow_symlinks=False):
+                    subfolders.append((entry.path, arcname))
+            # Reversed so the stack pops subfolders in name order
+            stack.extend(reversed(subfolders))
+    
+    @classmethod
+    def _read_ahead(cls, files: Iterable[tuple[str, str]]
+                    ) -> Iterator[tuple[str, zipfile.ZipInfo, Optional[bytes]]]:
+        """Read files on worker threads while the caller compresses earlier ones.
+        
+        At most a few files per worker are held in memory at once, and entries
+        are yielded in the order they were given. Files larger than
+        LARGE_FILE_SIZE are not read, so memory use stays bounded.
+        
+        Args:
+            files: Tuples of (file_path, arcname), e.g. from _iter_files.
+            
+        Yields:
+            Tuples of (file_path, zip_info, data) with the file's timestamp and
+            mode; data is None for large files.
+        """
+        def read(file_path: str, arcname: str) -> tuple[str, zipfile.ZipInfo, Optional[bytes]]:
+            # Clamp out-of-range mtimes (pre-1980, e.g. from a bad clock) to
+            # the zip epoch instead of failing the whole backup
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+            if zinfo.file_size > cls.LARGE_FILE_SIZE:
+                return file_path, zinfo, None
+            with open(file_path, 'rb') as f:
+                return file_path, zinfo, f.read()
+        
+        with ThreadPoolExecutor(max_workers=cls.READ_WORKERS) as executor:
+            pending = deque()
+            for file_path, arcname in files:
+                pending.append(executor.submit(read, file_path, arcname))
+                if len(pending) >= cls.READ_WORKERS * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _scan_backups(self) -> Iterator[tuple[str, float, int]]:
+        """Yield the backup files in the backup directory, unsorted.
+        
+        Yields:
+            Tuples of (path, mtime, size_bytes).
         """
         backup_dir = self.get_backup_directory()
         if not backup_dir or not backup_dir.exists():
-            return []
-        
-        backups = []
-        for backup_file in backup_dir.glob("*.zip"):
-            if backup_file.is_file():
-                stat = backup_file.stat()
-                creation_time = datetime.fromtimestamp(stat.st_mtime)
-                size = stat.st_size
-                backups.append((backup_file, creation_time, size))
+            return
+        
+        # Directory entries carry the file type, so only .zip files need a stat()
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".zip") and entry.is_file():
+                    stat = entry.stat()
+                    yield entry.path, stat.st_mtime, stat.st_size
+    
+    def list_backups(self) -> list[tuple[Path, datetime, int]]:
+        """List all available backups.
         
+        Returns:
+            List of tuples (backup_path, creation_time, size_bytes) sorted by creation time (newest first).
+        """
         # Sort by creation time, newest first
-        backups.sort(key=lambda x: x[1], reverse=True)
-        return backups
+        backups = sorted(self._scan_backups(), key=lambda x: x[1], reverse=True)
+        return [(Path(path), datetime.fromtimestamp(mtime), size) for path, mtime, size in backups]
     
     def restore_backup(self, backup_path: Path, restore_to: Optional[Path] = None) -> tuple[bool, str]:
         """Restore a backup to a profile folder.
@@ -201,12 +322,15 @@ class BackupManager:
             
             # Create restore directory
             restore_to.mkdir(parents=True, exist_ok=True)
+            # Directories known to exist, so each is only created once
+            created_dirs = {restore_to}
             
             # Extract backup
-            files_restored = 0
             profile_root = self.get_profile_name_from_backup(backup_path)
 
             with zipfile.ZipFile(backup_path, 'r') as zipf:
+                # Map members to their targets, creating directories up front
+                files_to_extract = []
                 for member in zipf.infolist():
                     member_path = Path(member.filename)
 
@@ -227,13 +351,33 @@ class BackupManager:
                     target_path = restore_to.joinpath(*parts)
 
                     if member.is_dir():
-                        target_path.mkdir(parents=True, exist_ok=True)
+                        if target_path not in created_dirs:
+                            target_path.mkdir(parents=True, exist_ok=True)
+                            created_dirs.add(target_path)
                         continue
 
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    with zipf.open(member, 'r') as source, target_path.open('wb') as dest:
-                        shutil.copyfileobj(source, dest)
-                    files_restored += 1
+                    target_dir = target_path.parent
+                    if target_dir not in created_dirs:
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(target_dir)
+                    files_to_extract.append((member, target_path))
+            
+            def extract(chunk: list[tuple[zipfile.ZipInfo, Path]]) -> None:
+                # A ZipFile isn't safe to share between threads (its open-file
+                # reference count is unlocked), so each worker opens its own
+                with zipfile.ZipFile(backup_path, 'r') as zipf:
+                    for member, target_path in chunk:
+                        with zipf.open(member, 'r') as source, target_path.open('wb') as dest:
+                            shutil.copyfileobj(source, dest, 1024 * 1024)
+            
+            # Each member is an independent deflate stream, so the workers'
+            # decompression and writes overlap
+            workers = max(1, min(self.RESTORE_WORKERS, len(files_to_extract)))
+            chunks = [files_to_extract[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume the results so worker errors are raised here
+                list(executor.map(extract, chunks))
+            files_restored = len(files_to_extract)
             
             return True, f"Restored {files_restored} files to {restore_to.name}"
             
@@ -258,6 +402,7 @@ class BackupManager:
         
         try:
             backup_path.unlink()
+            self._zip_summary_cache.pop(os.fspath(backup_path), None)
             return True, f"Deleted backup: {backup_path.name}"
         except PermissionError as e:
             return False, f"Permission denied: {e}"
@@ -270,28 +415,27 @@ class BackupManager:
         Returns:
             Dictionary with backup statistics (count, total_size_mb, oldest, newest).
         """
-        backups = self.list_backups()
-        
-        if not backups:
-            return {
-                'count': 0,
-                'total_size_mb': 0.0,
-                'oldest': None,
-                'newest': None
-            }
-        
-        total_size = sum(size for _, _, size in backups)
-        oldest = backups[-1][1] if backups else None
-        newest = backups[0][1] if backups else None
+        # Single pass over the directory; no list or sort needed for the totals
+        count = 0
+        total_size = 0
+        oldest = newest = None
+        for _, mtime, size in self._scan_backups():
+            count += 1
+            total_size += size
+            if oldest is None or mtime < oldest:
+                oldest = mtime
+            if newest is None or mtime > newest:
+                newest = mtime
         
         return {
-            'count': len(backups),
+            'count': count,
             'total_size_mb': total_size / (1024 * 1024),
-            'oldest': oldest,
-            'newest': newest
+            'oldest': datetime.fromtimestamp(oldest) if oldest is not None else None,
+            'newest': datetime.fromtimestamp(newest) if newest is not None else None
         }
     
-    def parse_backup_filename(self, backup_path: Path) -> Optional[dict]:
+    @staticmethod
+    def parse_backup_filename(backup_path: Path) -> Optional[dict]:
         """Parse backup filename to extract metadata.
         
         Expected format: {profile_name}_{timestamp}.zip
@@ -303,30 +447,100 @@ class BackupManager:
         Returns:
             Dictionary with metadata (profile_name, timestamp, datetime_obj) or None if invalid.
         """
+        filename = backup_path.stem  # Remove .zip extension
+        match = _BACKUP_NAME_RE.match(filename)
+        if match is None:
+            return None
+        
+        profile_name, date_str, time_str = match.groups()
         try:
-            filename = backup_path.stem  # Remove .zip extension
-            parts = filename.rsplit('_', 2)  # Split from right: name, date, time
-            
-            if len(parts) >= 3:
-                profile_name = '_'.join(parts[:-2])  # Everything before last 2 parts
-                date_str = parts[-2]  # YYYYMMDD
-                time_str = parts[-1]  # HHMMSS
-                timestamp_str = f"{date_str}_{time_str}"
-                
-                # Parse datetime
-                dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                
-                return {
-                    'profile_name': profile_name,
-                    'timestamp': timestamp_str,
-                    'datetime': dt,
-                    'filename': backup_path.name
-                }
+            # Build the datetime directly; strptime is slow when listing many backups
+            dt = datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]),
+                          int(time_str[:2]), int(time_str[2:4]), int(time_str[4:]))
+        except ValueError:
             return None
-        except (ValueError, IndexError):
+        
+        return {
+            'profile_name': profile_name,
+            'timestamp': f"{date_str}_{time_str}",
+            'datetime': dt,
+            'filename': backup_path.name
+        }
+    
+    @classmethod
+    def _read_zip_summary(cls, backup_path: Path, stat: os.stat_result) -> tuple[int, bool]:
+        """Get a backup's entry count and whether it opens as a zip.
+        
+        Results are cached per path and reused while the mtime and size
+        match, so listing the same backups again doesn't re-read every
+        archive's central directory. The cache keeps the most recently
+        used ZIP_SUMMARY_CACHE_SIZE archives.
+        
+        Args:
+            backup_path: Path to the backup file.
+            stat: The backup file's stat result.
+            
+        Returns:
+            Tuple of (file_count, is_valid).
+        """
+        path = os.fspath(backup_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cache = cls._zip_summary_cache
+        cached = cache.get(path)
+        if cached is not None and cached[0] == version:
+            summary = cached[1]
+            cache.move_to_end(path)
+        else:
+            try:
+                count = cls._read_zip_entry_count(backup_path, stat.st_size)
+                if count is None:
+                    summary = (0, False)
+                elif count == 0xFFFF:
+                    # Possibly a ZIP64 archive; let zipfile find the real count
+                    with zipfile.ZipFile(backup_path, 'r') as zipf:
+                        summary = (len(zipf.infolist()), True)
+                else:
+                    summary = (count, True)
+            except zipfile.BadZipFile:
+                summary = (0, False)
+            except Exception:
+                # Possibly transient (e.g. permissions); don't cache
+                return 0, False
+            # Overwrites any entry for an older version of this archive
+            cache[path] = (version, summary)
+            cache.move_to_end(path)
+            while len(cache) > cls.ZIP_SUMMARY_CACHE_SIZE:
+                cache.popitem(last=False)
+        return summary
+    
+    @staticmethod
+    def _read_zip_entry_count(backup_path: Path, size: int) -> Optional[int]:
+        """Read a zip's entry count from its end of central directory record.
+        
+        Only the file's tail is read, instead of parsing the whole central
+        directory like ZipFile does.
+        
+        Args:
+            backup_path: Path to the zip file.
+            size: File size in bytes.
+            
+        Returns:
+            Total entry count, or None if no end record was found (not a zip).
+        """
+        # The record is 22 bytes plus a comment of up to 64 KiB
+        tail_size = min(size, 22 + 0xFFFF)
+        with open(backup_path, 'rb') as f:
+            f.seek(size - tail_size)
+            tail = f.read(tail_size)
+        
+        index = tail.rfind(b'PK\x05\x06')
+        if index < 0 or len(tail) - index < 22:
             return None
+        # Total number of entries is the 16-bit field at offset 10
+        return int.from_bytes(tail[index + 10:index + 12], 'little')
     
-    def get_backup_metadata(self, backup_path: Path) -> dict:
+    @classmethod
+    def get_backup_metadata(cls, backup_path: Path) -> dict:
         """Get comprehensive metadata for a backup file.
         
         Args:
@@ -348,64 +562,57 @@ class BackupManager:
         }
         
         # Parse filename
-        parsed = self.parse_backup_filename(backup_path)
+        parsed = cls.parse_backup_filename(backup_path)
         if parsed:
             metadata['profile_name'] = parsed['profile_name']
             metadata['datetime'] = parsed['datetime']
             metadata['timestamp'] = parsed['timestamp']
         
         # Get file stats
-        if backup_path.exists():
-            try:
-                stat = backup_path.stat()
-                metadata['size_bytes'] = stat.st_size
-                metadata['size_mb'] = stat.st_size / (1024 * 1024)
-                
-                # Try to get file count from zip
-                try:
-                    with zipfile.ZipFile(backup_path, 'r') as zipf:
-                        metadata['file_count'] = len(zipf.namelist())
-                        metadata['is_valid'] = True
-                except zipfile.BadZipFile:
-                    metadata['is_valid'] = False
-            except Exception:
-                pass
+        try:
+            stat = backup_path.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            metadata['size_bytes'] = stat.st_size
+            metadata['size_mb'] = stat.st_size / (1024 * 1024)
+            metadata['file_count'], metadata['is_valid'] = cls._read_zip_summary(backup_path, stat)
         
         # Try to extract server from parent path
-        try:
-            # Look for server pattern in path (e.g., c_ccp_eve_tq_tranquility)
-            path_parts = backup_path.parts
-            for part in path_parts:
-                if 'tranquility' in part.lower():
-                    metadata['server'] = 'Tranquility'
-                    break
-                elif 'singularity' in part.lower() or 'sisi' in part.lower():
-                    metadata['server'] = 'Singularity'
-                    break
-                elif 'thunderdome' in part.lower():
-                    metadata['server'] = 'Thunderdome'
-                    break
-        except Exception:
-            pass
+        metadata['server'] = cls._server_from_path(backup_path)
         
         return metadata
     
+    @staticmethod
+    def _server_from_path(path: Path) -> str:
+        """Guess the server from a path's folders (e.g. c_ccp_eve_tq_tranquility).
+        
+        Args:
+            path: Backup file or directory path.
+            
+        Returns:
+            Server display name, or 'Unknown'.
+        """
+        match = _SERVER_RE.search(os.fspath(path))
+        return _SERVER_NAMES[match.group(0).lower()] if match else 'Unknown'
+    
     def group_backups_by_profile(self, backups: list) -> dict:
         """Group backups by profile name.
         
         Args:
-            backups: List of backup paths.
+            backups: List of backup paths, (path, ...) tuples or metadata dicts.
             
         Returns:
             Dictionary mapping profile names to lists of backup metadata.
         """
         grouped = {}
         
-        for backup_path in backups:
-            if isinstance(backup_path, tuple):
-                backup_path = backup_path[0]  # Extract path from tuple
-            
-            metadata = self.get_backup_metadata(backup_path)
+        for backup in backups:
+            if isinstance(backup, dict):
+                metadata = backup  # Already metadata, e.g. from list_all_backups_from_directories
+            else:
+                backup_path = backup[0] if isinstance(backup, tuple) else backup
+                metadata = self.get_backup_metadata(backup_path)
             profile_name = metadata['profile_name']
             
             if profile_name not in grouped:
@@ -425,7 +632,7 @@ class BackupManager:
         """Filter backups by profile name and/or server.
         
         Args:
-            backups: List of backup paths or tuples.
+            backups: List of backup paths, tuples or metadata dicts.
             profile: Optional profile name to filter by.
             server: Optional server name to filter by.
             
@@ -435,13 +642,20 @@ class BackupManager:
         filtered = []
         
         for backup in backups:
-            backup_path = backup[0] if isinstance(backup, tuple) else backup
-            metadata = self.get_backup_metadata(backup_path)
+            if isinstance(backup, dict):
+                backup_profile = backup['profile_name']
+                backup_server = backup['server']
+            else:
+                # Both filters come from the path alone; no need to open the zip
+                backup_path = backup[0] if isinstance(backup, tuple) else backup
+                parsed = self.parse_backup_filename(backup_path) if profile else None
+                backup_profile = parsed['profile_name'] if parsed else 'Unknown'
+                backup_server = self._server_from_path(backup_path) if server else 'Unknown'
             
             # Apply filters
-            if profile and metadata['profile_name'] != profile:
+            if profile and backup_profile != profile:
                 continue
-            if server and metadata['server'] != server:
+            if server and backup_server != server:
                 continue
             
             filtered.append(backup)
@@ -471,7 +685,7 @@ class BackupManager:
                     return False, f"Corrupted file in archive: {result}"
                 
                 # Check if there are any files
-                if len(zipf.namelist()) == 0:
+                if not zipf.infolist():
                     return False, "Backup is empty"
                 
                 return True, "Backup is valid"
@@ -506,40 +720,52 @@ class BackupManager:
         """
         backup_dirs = []
         
-        for base_path in search_paths:
-            if not base_path.exists():
-                continue
+        search_paths = [base_path for base_path in search_paths if base_path.exists()]
+        if not search_paths:
+            return backup_dirs
+        
+        # Walk the installations concurrently; each walk is I/O-latency bound
+        with ThreadPoolExecutor(max_workers=min(8, len(search_paths))) as executor:
+            found_per_path = list(executor.map(BackupManager._find_backup_directories, search_paths))
+        
+        for base_path, found in zip(search_paths, found_per_path):
+            for item in found:
+                backup_dirs.append({
+                    'backup_dir': item,
+                    'installation_path': base_path,
+                    'server_name': BackupManager._server_from_path(item),
+                    'parent_dir': item.parent  # The server/installation directory
+                })
+        
+        return backup_dirs
+    
+    @staticmethod
+    def _find_backup_directories(base_path: Path) -> list[Path]:
+        """Find the backup directories anywhere below a base path.
+        
+        Walks with os.scandir and doesn't descend into backup directories
+        themselves or into symlinked directories. Unreadable folders are skipped.
+        
+        Args:
+            base_path: Directory to search.
             
+        Returns:
+            List of backup directory paths.
+        """
+        found = []
+        stack = [os.fspath(base_path)]
+        while stack:
+            folder = stack.pop()
             try:
-                # Look for backup directories
-                for item in base_path.rglob(BackupManager.BACKUP_DIR_NAME):
-                    if item.is_dir():
-                        # Extract server info from path
-                        server_name = 'Unknown'
-                        installation_path = base_path
-                        
-                        # Try to find server folder in path
-                        for part in item.parts:
-                            if 'tranquility' in part.lower():
-                                server_name = 'Tranquility'
-                                break
-                            elif 'singularity' in part.lower() or 'sisi' in part.lower():
-                                server_name = 'Singularity'
-                                break
-                            elif 'thunderdome' in part.lower():
-                                server_name = 'Thunderdome'
-                                break
-                        
-                        backup_dirs.append({
-                            'backup_dir': item,
-                            'installation_path': installation_path,
-                            'server_name': server_name,
-                            'parent_dir': item.parent  # The server/installation directory
-                        })
-            except PermissionError:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name == BackupManager.BACKUP_DIR_NAME and entry.is_dir():
+                            found.append(Path(entry.path))
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
                 continue
-        
-        return backup_dirs
+        return found
     
     @staticmethod
     def list_all_backups_from_directories(backup_directories: list[dict]) -> list[dict]:
@@ -560,11 +786,11 @@ class BackupManager:
                 continue
             
             try:
-                for backup_file in backup_dir.glob("*.zip"):
-                    if backup_file.is_file():
-                        # Create temporary BackupManager to use metadata methods
-                        temp_manager = BackupManager(dir_info['parent_dir'])
-                        metadata = temp_manager.get_backup_metadata(backup_file)
+                with os.scandir(backup_dir) as entries:
+                    for entry in entries:
+                        if not (entry.name.endswith(".zip") and entry.is_file()):
+                            continue
+                        metadata = BackupManager.get_backup_metadata(Path(entry.path))
                         
                         # Add installation and server info
                         metadata['installation_path'] = dir_info['installation_path']
@@ -1,8 +1,9 @@
 """Core business logic for EVE settings management."""
 
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional, Tuple
 
 from .paths import EVEPathResolver
 from .models import SettingFile
@@ -23,7 +24,6 @@ class SettingsManager:
         self.settings_folders: List[Path] = []
         self.char_list: List[SettingFile] = []
         self.user_list: List[SettingFile] = []
-        self.file_to_folder: Dict[Path, Path] = {}
     
     def discover_settings_folders(self) -> List[Path]:
         """Discover EVE settings directories.
@@ -59,6 +59,10 @@ class SettingsManager:
     def load_files(self, settings_folders: List[Path]) -> List[int]:
         """Load and sort character and account settings files from all settings directories.
         
+        char_list and user_list are replaced with new objects
+        rather than cleared in place, so callers may keep references to the
+        previous lists without copying them.
+        
         Args:
             settings_folders: List of paths to settings folders to load from.
             
@@ -66,63 +70,112 @@ class SettingsManager:
             List of character IDs that need names fetched.
         """
         self.settings_folders = settings_folders
-        self.char_list.clear()
-        self.user_list.clear()
-        self.file_to_folder.clear()
+        self.char_list = []
+        self.user_list = []
         
         # Collect all character IDs for bulk fetch
         character_ids = []
         
-        # Load files from all found settings directories
-        for settings_folder in settings_folders:
-            for file_path in settings_folder.iterdir():
-                if file_path.is_file():
-                    setting_file = SettingFile(file_path, api_cache=self.api_cache)
-                    
-                    if setting_file.is_char_file():
-                        # Only add if ID is valid (non-zero and at least 7 digits)
-                        if setting_file.id > 0:
-                            self.char_list.append(setting_file)
-                            self.file_to_folder[setting_file.path] = settings_folder
-                            character_ids.append(setting_file.id)
-                    elif setting_file.is_user_file():
-                        self.user_list.append(setting_file)
-                        self.file_to_folder[setting_file.path] = settings_folder
+        # Folder scans are independent and I/O-bound; run them concurrently and
+        # merge in input order so the result matches a sequential scan
+        if len(settings_folders) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(settings_folders))) as executor:
+                results = list(executor.map(self._scan_folder, settings_folders))
+        else:
+            results = [self._scan_folder(folder) for folder in settings_folders]
+        
+        for chars, users in results:
+            self.char_list.extend(chars)
+            self.user_list.extend(users)
+            character_ids.extend(setting_file.id for setting_file in chars)
         
         # Sort by last modified (most recent first)
-        self.char_list.sort(key=lambda f: f.last_modified(), reverse=True)
-        self.user_list.sort(key=lambda f: f.last_modified(), reverse=True)
+        self.char_list.sort(key=lambda f: f.mtime, reverse=True)
+        self.user_list.sort(key=lambda f: f.mtime, reverse=True)
         
         return character_ids
     
-    def copy_settings_to_targets(self, source_file: SettingFile) -> int:
+    def _scan_folder(self, settings_folder: Path) -> Tuple[List[SettingFile], List[SettingFile]]:
+        """Scan one settings folder for character and account files.
+        
+        Args:
+            settings_folder: Settings folder to scan.
+            
+        Returns:
+            Tuple of (character files, account files) in directory order.
+        """
+        chars = []
+        users = []
+        prefixes = (SettingFile.CHAR_PREFIX, SettingFile.USER_PREFIX)
+        # Both prefixes have the same length; a further '_' marks the
+        # core_char__/core_user__ default templates
+        marker = len(SettingFile.CHAR_PREFIX)
+        
+        with os.scandir(settings_folder) as entries:
+            for entry in entries:
+                # Check the name first so other files (prefs, caches) and the
+                # templates are never turned into SettingFiles or stat'ed
+                name = entry.name
+                if not name.startswith(prefixes) or name[marker:marker + 1] == "_" or not entry.is_file():
+                    continue
+                setting_file = SettingFile(settings_folder / name, api_cache=self.api_cache,
+                                           folder=settings_folder)
+                
+                if setting_file.is_char_file():
+                    # Only add if ID is valid (non-zero and at least 7 digits)
+                    if setting_file.id <= 0:
+                        continue
+                    chars.append(setting_file)
+                elif setting_file.is_user_file():
+                    users.append(setting_file)
+                else:
+                    continue
+                # Reuse the scan's stat result so each file is stat'ed only once
+                setting_file.refresh_mtime(entry.stat().st_mtime)
+        
+        return chars, users
+    
+    def copy_settings_to_targets(self, source_file: SettingFile,
+                                 targets: Optional[List[SettingFile]] = None) -> int:
         """Copy settings from source file to all other files of the same type.
         
         Only copies to files in the same settings folder.
         
         Args:
             source_file: The file to use as source for copying.
+            targets: Files to copy to. If None, all loaded files of the same type.
             
         Returns:
             Number of files copied.
         """
         # Get the appropriate list (char or user)
-        file_list = self.char_list if source_file.is_char_file() else self.user_list
+        if targets is not None:
+            file_list = targets
+        else:
+            file_list = self.char_list if source_file.is_char_file() else self.user_list
         
-        # Get the source file's folder
-        source_folder = self.file_to_folder.get(source_file.path)
+        source_folder = source_file.folder
         
         copied_count = 0
+        # Source contents and times, read once on the first copy instead of once per target
+        source_data = None
+        source_stat = None
         
         # Copy to all other files in the same folder
         for target_file in file_list:
-            target_folder = self.file_to_folder.get(target_file.path)
-            
             # Only copy within the same settings folder
             if (target_file.path != source_file.path and 
-                target_folder == source_folder):
+                target_file.folder == source_folder):
                 try:
-                    shutil.copy2(source_file.path, target_file.path)
+                    if source_data is None:
+                        source_stat = source_file.path.stat()
+                        source_data = source_file.path.read_bytes()
+                    # Contents, then the source's times so the target shows the
+                    # same last-modified date (the part of shutil.copy2 that matters here)
+                    with open(target_file.path, 'wb') as f:
+                        f.write(source_data)
+                    os.utime(target_file.path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+                    target_file.refresh_mtime(source_stat.st_mtime)
                     folder_name = source_folder.name if source_folder else "unknown"
                     print(f"Copied {source_file.path.name} to {target_file.path.name} in {folder_name}")
                     copied_count += 1
@@ -132,6 +185,7 @@ class SettingsManager:
         
         return copied_count
     
-    def copy_settings(self, source_file: SettingFile) -> int:
+    def copy_settings(self, source_file: SettingFile,
+                      targets: Optional[List[SettingFile]] = None) -> int:
         """Deprecated: Use copy_settings_to_targets() instead."""
-        return self.copy_settings_to_targets(source_file)
+        return self.copy_settings_to_targets(source_file, targets)
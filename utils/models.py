@@ -1,10 +1,14 @@
 """Data models for EVE settings files."""
 
+import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from dataclasses import dataclass
 
+# Character/account IDs in settings filenames are at least 7 digits
+_ID_RE = re.compile(r'\d{7,}')
+
 
 @dataclass
 class CharacterESIResponse:
@@ -19,35 +23,86 @@ class CharacterESIResponse:
 class SettingFile:
     """Represents an EVE settings file (character or account)."""
     
+    # One instance per settings file, often thousands across folders
+    __slots__ = ('path', 'name', 'api_cache', 'folder', 'folder_name',
+                 '_mtime', '_date_str', 'id', 'id_str', '_is_char', '_is_user')
+    
     CHAR_PREFIX = "core_char_"
     USER_PREFIX = "core_user_"
     
-    def __init__(self, file_path: Path, api_cache=None):
+    # Formatted dates by whole-second mtime, shared by all files (files are
+    # often written in the same second, e.g. by a settings copy)
+    _date_cache: Dict[int, str] = {}
+    
+    def __init__(self, file_path: Path, api_cache=None, mtime: Optional[float] = None,
+                 folder: Optional[Path] = None):
         """Initialize a settings file.
         
         Args:
             file_path: Path to the settings file.
             api_cache: Optional ESICache instance for character name resolution.
+            mtime: Modification time if already known (e.g. from a directory scan).
+            folder: Settings folder the file was loaded from. Defaults to the
+                file's parent directory.
         """
         self.path = file_path
         self.name = file_path.name
+        self.folder = file_path.parent if folder is None else folder
+        # Settings folder name shown in the display string
+        self.folder_name = self.folder.name
         self.api_cache = api_cache
+        self._mtime: Optional[float] = None
+        self._date_str: Optional[str] = None
+        if mtime is not None:
+            self.refresh_mtime(mtime)
         
-        # Extract numeric ID from filename
-        extracted_id = int(''.join(filter(str.isdigit, self.name)) or '0')
+        # Extract numeric ID from filename (the first run of 7+ digits)
+        match = _ID_RE.search(self.name)
+        extracted_id = int(match.group()) if match else 0
         # Character IDs must be at least 7 digits and non-zero
         if extracted_id == 0 or extracted_id < 1000000:
             self.id = 0  # Mark as invalid
         else:
             self.id = extracted_id
+        # String form of the ID, used as treeview iid/value and notes key
+        self.id_str = str(self.id)
+        
+        # The kind depends only on the filename; core_char__/core_user__ are templates
+        self._is_char = self.name.startswith(self.CHAR_PREFIX) and not self.name.startswith("core_char__")
+        self._is_user = self.name.startswith(self.USER_PREFIX) and not self.name.startswith("core_user__")
+    
+    @property
+    def mtime(self) -> float:
+        """Modification time of the file, read from disk only once."""
+        if self._mtime is None:
+            self.refresh_mtime()
+        return self._mtime
+    
+    @property
+    def date_str(self) -> str:
+        """Modification time formatted for display."""
+        if self._date_str is None:
+            seconds = int(self.mtime)
+            date_str = self._date_cache.get(seconds)
+            if date_str is None:
+                date_str = datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+                self._date_cache[seconds] = date_str
+            self._date_str = date_str
+        return self._date_str
+    
+    def refresh_mtime(self, mtime: Optional[float] = None) -> None:
+        """Update the cached modification time, e.g. after the file was overwritten.
+        
+        Args:
+            mtime: New modification time. If None, the file is stat'ed.
+        """
+        self._mtime = self.path.stat().st_mtime if mtime is None else mtime
+        self._date_str = None
     
     def __str__(self) -> str:
         """String representation for display in GUI."""
-        last_modified = datetime.fromtimestamp(self.path.stat().st_mtime)
-        date_str = last_modified.strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Get folder name for display
-        folder_name = self.path.parent.name
+        date_str = self.date_str
+        folder_name = self.folder_name
         
         if self.is_char_file():
             char_name = self.get_char_name()
@@ -87,7 +142,7 @@ class SettingFile:
         Returns:
             True if character file, False otherwise.
         """
-        return self.name.startswith(self.CHAR_PREFIX) and not self.name.startswith("core_char__")
+        return self._is_char
     
     def is_user_file(self) -> bool:
         """Check if this is an account settings file.
@@ -95,7 +150,7 @@ class SettingFile:
         Returns:
             True if account file, False otherwise.
         """
-        return self.name.startswith(self.USER_PREFIX) and not self.name.startswith("core_user__")
+        return self._is_user
     
     def last_modified(self) -> datetime:
         """Get last modified time of the file.
@@ -103,4 +158,4 @@ class SettingFile:
         Returns:
             datetime of last modification.
         """
-        return datetime.fromtimestamp(self.path.stat().st_mtime)
+        return datetime.fromtimestamp(self.mtime)
@@ -1,15 +1,35 @@
 """Path resolution for EVE Online installation and settings."""
 
+import logging
 import os
+import re
+import time
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple
 from .platform_detector import Platform, detect_platform
 from .exceptions import SettingsNotFoundError, PlatformNotSupportedError
 
+logger = logging.getLogger(__name__)
+
+# Matches core_char_*/core_user_* settings files; the [^_] rejects the
+# core_char__/core_user__ default templates in the same pass
+_SETTINGS_FILE_RE = re.compile(r'core_(char|user)_[^_]')
+
+# Folder suffixes of well-known servers, used when a server folder wasn't found
+_SERVER_FOLDER_SUFFIXES = {
+    'tranquility': 'tq_tranquility',
+    'singularity': 'sisi_singularity',
+    'duality': 'duality',
+    'serenity': 'serenity'
+}
+
 
 class EVEPathResolver:
     """Resolves paths to EVE Online installation and settings folders."""
     
+    # Seconds an existence check of a candidate EVE directory is reused
+    EXISTS_CACHE_TTL = 1.0
+    
     def __init__(self, server: Optional[str] = None, custom_paths: Optional[List[str]] = None):
         """Initialize the path resolver.
         
@@ -20,27 +40,101 @@ class EVEPathResolver:
         self.platform = detect_platform()
         self.server = server or 'tranquility'
         self.custom_paths = [Path(p) for p in (custom_paths or [])]
+        self._servers_cache: Optional[Tuple[tuple, Dict[str, str]]] = None
+        # Directory lookups keyed by path (and server), stored with the
+        # directory state they were computed from
+        self._base_path_cache: Dict[str, Tuple[tuple, Optional[Path]]] = {}
+        self._folders_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+        self._valid_folder_cache: Dict[Path, Tuple[int, bool]] = {}
+        # Candidate directory existence (path -> (expires_at, exists)); most
+        # candidates are missing, so these are mostly negative results
+        self._exists_cache: Dict[Path, Tuple[float, bool]] = {}
+        # Directories already reported as inaccessible, warned about only once
+        self._denied_paths: Set[Path] = set()
+        self._windows_eve_dir: Optional[Path] = None
+        self._linux_eve_dirs: Optional[Tuple[Path, ...]] = None
+    
+    def refresh(self) -> None:
+        """Forget cached directory lookups so the next calls rescan the disk."""
+        self._servers_cache = None
+        self._base_path_cache.clear()
+        self._folders_cache.clear()
+        self._valid_folder_cache.clear()
+        self._exists_cache.clear()
+    
+    def _warn_permission_denied(self, path: Path) -> None:
+        """Log an inaccessible directory, once per path.
+        
+        Args:
+            path: Directory that could not be read.
+        """
+        if path not in self._denied_paths:
+            self._denied_paths.add(path)
+            logger.warning("Permission denied accessing %s", path)
+    
+    def _cached_exists(self, path: Path) -> bool:
+        """Check whether a candidate directory exists, reusing recent results.
+        
+        Args:
+            path: Path to check.
+            
+        Returns:
+            True if the path existed when last checked within EXISTS_CACHE_TTL.
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        # A bare stat skips pathlib's per-call wrapping; any error (missing,
+        # not a directory, no access) means the candidate is unusable
+        try:
+            os.stat(path)
+            exists = True
+        except OSError:
+            exists = False
+        self._exists_cache[path] = (now + self.EXISTS_CACHE_TTL, exists)
+        return exists
     
     def discover_servers(self) -> Dict[str, str]:
         """Discover all available EVE servers.
         
+        Results are cached and only rescanned when the set of scanned
+        directories or any of their modification times change.
+        
         Returns:
-            Dictionary mapping display names to server folder names.
+            Dictionary mapping display names to server folder names, ordered by display name.
             Example: {'Tranquility': 'c_ccp_eve_tq_tranquility', 'Singularity': 'c_ccp_eve_sisi_singularity'}
         """
-        servers = {}
-        
-        # Check default base directory
+        # Directories to scan: default base directory, then custom paths
+        roots = []
         base_dir = self._get_eve_base_directory()
-        if base_dir and base_dir.exists():
-            self._scan_for_servers(base_dir, servers)
+        if base_dir:
+            roots.append(base_dir)
+        roots.extend(self.custom_paths)
+        
+        # Cache key: every existing root with its mtime (adding/removing a
+        # server folder updates the parent directory's mtime)
+        key = []
+        for root in roots:
+            try:
+                key.append((str(root), os.stat(root).st_mtime_ns))
+            except OSError:
+                continue
+        key = tuple(key)
+        
+        if self._servers_cache is not None and self._servers_cache[0] == key:
+            return dict(self._servers_cache[1])
+        
+        servers = {}
+        for root_str, _ in key:
+            self._scan_for_servers(Path(root_str), servers)
         
-        # Check custom paths
-        for custom_path in self.custom_paths:
-            if custom_path.exists():
-                self._scan_for_servers(custom_path, servers)
+        # Keep servers ordered by display name so callers can use them as-is
+        servers = dict(sorted(servers.items()))
         
-        return servers
+        self._servers_cache = (key, servers)
+        return dict(servers)
     
     def _scan_for_servers(self, base_dir: Path, servers: Dict[str, str]) -> None:
         """Scan a directory for EVE server folders.
@@ -50,19 +144,21 @@ class EVEPathResolver:
             servers: Dictionary to add found servers to.
         """
         try:
-            for item in base_dir.iterdir():
-                if item.is_dir() and item.name.startswith('c_ccp_eve_'):
-                    # Extract server name from folder (e.g., c_ccp_eve_tq_tranquility -> tranquility)
-                    parts = item.name.split('_')
-                    if len(parts) >= 4:
-                        # Get the last part as the server name
-                        server_name = parts[-1]
-                        # Capitalize for display
-                        display_name = server_name.capitalize()
-                        # Store full path as value instead of just folder name
-                        servers[display_name] = str(item)
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('c_ccp_eve_') and entry.is_dir():
+                        # Extract server name from folder (e.g., c_ccp_eve_tq_tranquility -> tranquility)
+                        server_name = name.rsplit('_', 1)[-1]
+                        if server_name:
+                            # Capitalize for display
+                            display_name = server_name.capitalize()
+                            # Store full path as value instead of just folder name
+                            servers[display_name] = entry.path
         except PermissionError:
-            print(f"Warning: Permission denied accessing {base_dir}")
+            self._warn_permission_denied(base_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
     
     def _get_eve_base_directory(self) -> Optional[Path]:
         """Get the base EVE directory containing server folders.
@@ -71,28 +167,51 @@ class EVEPathResolver:
             Path to EVE base directory (one level above server folders), or None if not found.
         """
         if self.platform == Platform.WINDOWS:
-            username = os.environ.get('USERNAME') or os.environ.get('USER')
-            if not username:
-                return None
-            return Path(f"C:/Users/{username}/AppData/Local/CCP/EVE")
+            return self._get_windows_eve_dir()
         
         elif self.platform == Platform.LINUX:
-            username = os.environ.get('USER')
-            if not username:
-                return None
-            
-            # Try Steam Proton path first (most common)
-            steam_path = Path(f"/home/{username}/.steam/steam/steamapps/compatdata/8500/pfx/drive_c/users/steamuser/AppData/Local/CCP/EVE")
-            if steam_path.exists():
-                return steam_path
-            
-            # Try Wine path as fallback
-            wine_path = Path.home() / ".eve/wineenv/drive_c/users" / username / "Local Settings/Application Data/CCP/EVE"
-            if wine_path.exists():
-                return wine_path
+            return next((path for path in self._get_linux_eve_dirs() if self._cached_exists(path)), None)
         
         return None
     
+    def _get_linux_eve_dirs(self) -> Tuple[Path, ...]:
+        """Get the candidate Linux CCP/EVE directories, most common first.
+        
+        The candidates are built once and cached on the instance.
+        
+        Returns:
+            Steam Proton directory, then the Wine directory if $USER is set.
+        """
+        if self._linux_eve_dirs is None:
+            home = Path.home()
+            candidates = [home / ".steam/steam/steamapps/compatdata/8500/pfx/drive_c/users/steamuser/AppData/Local/CCP/EVE"]
+            username = os.environ.get('USER')
+            if username:
+                candidates.append(home / ".eve/wineenv/drive_c/users" / username / "Local Settings/Application Data/CCP/EVE")
+            self._linux_eve_dirs = tuple(candidates)
+        return self._linux_eve_dirs
+    
+    def _get_windows_eve_dir(self) -> Optional[Path]:
+        """Get the Windows CCP/EVE directory under the user's local app data.
+        
+        Uses %LOCALAPPDATA% (which follows redirected profiles and non-C:
+        drives), falling back to C:/Users/<username>/AppData/Local. The
+        result is cached on the instance.
+        
+        Returns:
+            Path to the EVE directory, or None if it cannot be determined.
+        """
+        if self._windows_eve_dir is None:
+            local_app_data = os.environ.get('LOCALAPPDATA')
+            if local_app_data:
+                self._windows_eve_dir = Path(local_app_data) / "CCP" / "EVE"
+            else:
+                username = os.environ.get('USERNAME') or os.environ.get('USER')
+                if not username:
+                    return None
+                self._windows_eve_dir = Path(f"C:/Users/{username}/AppData/Local/CCP/EVE")
+        return self._windows_eve_dir
+    
     def get_server_folder_name(self, server: Optional[str] = None) -> str:
         """Get the folder name for a specific server.
         
@@ -104,22 +223,14 @@ class EVEPathResolver:
         """
         server_name = (server or self.server).lower()
         
-        # Try to find the exact folder name from discovered servers
-        servers = self.discover_servers()
-        for display_name, folder_name in servers.items():
-            if display_name.lower() == server_name:
-                return folder_name
+        # Try to find the exact folder name from discovered servers (keyed by
+        # capitalized display name)
+        folder_name = self.discover_servers().get(server_name.capitalize())
+        if folder_name is not None:
+            return folder_name
         
         # Fallback to constructed name
-        # Map common server names to their abbreviations
-        server_map = {
-            'tranquility': 'tq_tranquility',
-            'singularity': 'sisi_singularity',
-            'duality': 'duality',
-            'serenity': 'serenity'
-        }
-        
-        server_suffix = server_map.get(server_name, server_name)
+        server_suffix = _SERVER_FOLDER_SUFFIXES.get(server_name, server_name)
         return f'c_ccp_eve_{server_suffix}'
     
     def get_base_path(self, server: Optional[str] = None) -> Optional[Path]:
@@ -137,6 +248,29 @@ class EVEPathResolver:
         # First check if server folder is from custom paths (will be full path)
         servers = self.discover_servers()
         server_key = (server or self.server).capitalize()
+        
+        # Reuse the last result while the scanned directories are unchanged
+        state = self._servers_cache[0] if self._servers_cache else ()
+        cached = self._base_path_cache.get(server_key)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        
+        base_path = self._resolve_base_path(server, servers, server_key)
+        self._base_path_cache[server_key] = (state, base_path)
+        return base_path
+    
+    def _resolve_base_path(self, server: Optional[str], servers: Dict[str, str],
+                           server_key: str) -> Optional[Path]:
+        """Resolve the EVE base path for a server without caching.
+        
+        Args:
+            server: Server name passed to get_base_path().
+            servers: Discovered servers.
+            server_key: Display name of the server.
+            
+        Returns:
+            Path to EVE settings base directory for the server, or None if not found.
+        """
         if server_key in servers:
             server_path_str = servers[server_key]
             # If it's a full path (from custom paths), return it
@@ -166,13 +300,13 @@ class EVEPathResolver:
         Returns:
             Path to Windows EVE settings directory, or None if not found.
         """
-        username = os.environ.get('USERNAME') or os.environ.get('USER')
-        if not username:
+        eve_dir = self._get_windows_eve_dir()
+        if eve_dir is None:
             return None
         
         server_folder = self.get_server_folder_name(server)
-        eve_base = Path(f"C:/Users/{username}/AppData/Local/CCP/EVE/{server_folder}")
-        if eve_base.exists():
+        eve_base = eve_dir / server_folder
+        if self._cached_exists(eve_base):
             return eve_base
         return None
     
@@ -185,23 +319,9 @@ class EVEPathResolver:
         Returns:
             Path to Linux Steam EVE settings directory, or None if not found.
         """
-        username = os.environ.get('USER')
-        if not username:
-            return None
-        
         server_folder = self.get_server_folder_name(server)
-        
-        # Try Steam Proton path first (most common)
-        steam_path = Path(f"/home/{username}/.steam/steam/steamapps/compatdata/8500/pfx/drive_c/users/steamuser/AppData/Local/CCP/EVE/{server_folder}")
-        if steam_path.exists():
-            return steam_path
-        
-        # Try Wine path as fallback
-        wine_path = Path.home() / ".eve/wineenv/drive_c/users" / username / "Local Settings/Application Data/CCP/EVE" / server_folder
-        if wine_path.exists():
-            return wine_path
-        
-        return None
+        candidates = (eve_dir / server_folder for eve_dir in self._get_linux_eve_dirs())
+        return next((path for path in candidates if self._cached_exists(path)), None)
     
     def find_settings_folders(self, base_path: Optional[Path] = None) -> List[Path]:
         """Find all settings_* folders in the EVE base path.
@@ -215,19 +335,33 @@ class EVEPathResolver:
         if base_path is None:
             base_path = self.get_base_path()
         
-        if base_path is None or not base_path.exists():
+        if base_path is None:
+            return []
+        
+        # Adding or removing a settings folder updates the base path's mtime
+        try:
+            mtime = base_path.stat().st_mtime_ns
+        except OSError:
             return []
+        cached = self._folders_cache.get(base_path)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
         
-        settings_folders = []
         try:
-            for item in base_path.iterdir():
-                if item.is_dir() and item.name.startswith('settings_'):
-                    settings_folders.append(item)
+            with os.scandir(base_path) as entries:
+                # Check the name first; is_dir() uses the cached entry type
+                names = [entry.name for entry in entries
+                         if entry.name.startswith('settings_') and entry.is_dir()]
         except PermissionError:
-            print(f"Warning: Permission denied accessing {base_path}")
+            self._warn_permission_denied(base_path)
             return []
         
-        return sorted(settings_folders)
+        # Sort plain names, case-folded where Paths are (Windows), so the order
+        # matches sorting the Paths, then build Paths only for the results
+        names.sort(key=os.path.normcase)
+        settings_folders = [base_path / name for name in names]
+        self._folders_cache[base_path] = (mtime, settings_folders)
+        return list(settings_folders)
     
     def validate_settings_folder(self, folder: Path) -> bool:
         """Validate that a folder contains required EVE settings files.
@@ -242,24 +376,49 @@ class EVEPathResolver:
         Returns:
             True if folder contains valid settings files, False otherwise.
         """
-        if not folder.exists() or not folder.is_dir():
+        # Adding or removing files updates the folder's mtime
+        try:
+            mtime = folder.stat().st_mtime_ns
+        except OSError:
             return False
+        cached = self._valid_folder_cache.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         
+        valid = self._scan_settings_folder(folder)
+        self._valid_folder_cache[folder] = (mtime, valid)
+        return valid
+    
+    def _scan_settings_folder(self, folder: Path) -> bool:
+        """Check a folder's files for character and user settings files.
+        
+        Args:
+            folder: Path to the settings folder to scan.
+            
+        Returns:
+            True if folder contains valid settings files, False otherwise.
+        """
         has_char = False
         has_user = False
         
         try:
-            for file_path in folder.iterdir():
-                if file_path.is_file():
-                    name = file_path.name
-                    if name.startswith("core_char_") and not name.startswith("core_char__"):
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    match = _SETTINGS_FILE_RE.match(entry.name)
+                    if match is None:
+                        continue
+                    is_char = match.group(1) == "char"
+                    # Only a name that would flip a flag needs the file type check
+                    if (has_char if is_char else has_user) or not entry.is_file():
+                        continue
+                    if is_char:
                         has_char = True
-                    if name.startswith("core_user_") and not name.startswith("core_user__"):
+                    else:
                         has_user = True
                     
                     if has_char and has_user:
                         return True
-        except PermissionError:
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
             return False
         
         return False
@@ -1,7 +1,8 @@
 """Platform detection for PyEveSettings."""
 
-import platform
+import sys
 from enum import Enum
+from functools import lru_cache
 from .exceptions import PlatformNotSupportedError
 
 
@@ -13,19 +14,21 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+@lru_cache(maxsize=None)
 def detect_platform() -> Platform:
     """Detect the current operating system platform.
     
+    The result is cached; the platform doesn't change while running.
+    
     Returns:
         Platform enum value.
     """
-    system = platform.system().lower()
-    
-    if system == "windows":
+    # sys.platform is fixed at build time; no need for the platform module
+    if sys.platform == "win32":
         return Platform.WINDOWS
-    elif system == "linux":
+    elif sys.platform.startswith("linux"):
         return Platform.LINUX
-    elif system == "darwin":
+    elif sys.platform == "darwin":
         return Platform.MACOS
     else:
         return Platform.UNKNOWN